@@ -0,0 +1,200 @@
+"""Cache Module"""
+__docformat__ = "google"
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import tempfile
+import time
+from collections.abc import Callable
+
+import pandas as pd
+
+CACHE_DIRECTORY = os.path.join(os.path.expanduser("~"), ".cache", "financetoolkit")
+
+
+class FileCache:
+    """
+    The FileCache stores DataFrames on disk together with the moment they were
+    stored and the amount of seconds they remain valid (time-to-live). This prevents
+    having to collect the same data from the API over and over again.
+
+    Each entry consists of a pickle file containing the DataFrame and a JSON file
+    containing the timestamp and time-to-live, stored as {directory}/{endpoint}/{key}.
+    """
+
+    def __init__(self, directory: str = CACHE_DIRECTORY):
+        """
+        Initializes the FileCache Class.
+
+        Args:
+            directory (str): The directory to store the cached data in. Defaults
+                to ~/.cache/financetoolkit.
+        """
+        self._directory = directory
+
+    def get_path(self, endpoint: str, key: str) -> str:
+        """
+        Get the path of a cache entry without extension.
+
+        Args:
+            endpoint (str): The endpoint the data belongs to.
+            key (str): The key of the cache entry.
+
+        Returns:
+            str: The path of the cache entry.
+        """
+        return os.path.join(self._directory, endpoint, key)
+
+    def load(self, endpoint: str, key: str) -> pd.DataFrame | None:
+        """
+        Load a DataFrame from the cache if it exists and hasn't expired yet.
+
+        Args:
+            endpoint (str): The endpoint the data belongs to.
+            key (str): The key of the cache entry.
+
+        Returns:
+            pd.DataFrame | None: The cached DataFrame or None if not available.
+        """
+        path = self.get_path(endpoint, key)
+
+        try:
+            with open(f"{path}.json", encoding="utf-8") as metadata_file:
+                metadata = json.load(metadata_file)
+
+            if time.time() - metadata["timestamp"] > metadata["ttl"]:
+                return None
+
+            return pd.read_pickle(f"{path}.pickle")
+        except (
+            OSError,
+            ValueError,
+            KeyError,
+            TypeError,
+            EOFError,
+            AttributeError,
+            ImportError,
+            pickle.UnpicklingError,
+        ):
+            # A corrupted entry, or one written by an incompatible version of pandas,
+            # is treated the same as a missing entry and is overwritten afterwards
+            return None
+
+    def save(self, endpoint: str, key: str, data: pd.DataFrame, ttl: int):
+        """
+        Save a DataFrame to the cache. Failing to write the cache, e.g. due to
+        a read-only file system, is ignored as the data itself is still returned.
+
+        Args:
+            endpoint (str): The endpoint the data belongs to.
+            key (str): The key of the cache entry.
+            data (pd.DataFrame): The DataFrame to store.
+            ttl (int): The amount of seconds the entry remains valid.
+        """
+        path = self.get_path(endpoint, key)
+
+        def write_metadata(metadata_path: str):
+            with open(metadata_path, "w", encoding="utf-8") as metadata_file:
+                json.dump({"timestamp": time.time(), "ttl": ttl}, metadata_file)
+
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+            self.write_file(f"{path}.pickle", data.to_pickle)
+            self.write_file(f"{path}.json", write_metadata)
+        except OSError:
+            pass
+
+    def write_file(self, path: str, write: Callable[[str], None]):
+        """
+        Write a file through a uniquely named temporary file in the same directory
+        which then replaces the file. Concurrent readers therefore never encounter a
+        partially written file and concurrent writers never write to the same file.
+
+        Args:
+            path (str): The path of the file to write.
+            write (Callable[[str], None]): The function that writes to the given path.
+        """
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=os.path.dirname(path), suffix=".tmp"
+        )
+        os.close(file_descriptor)
+
+        try:
+            write(temporary_path)
+            os.replace(temporary_path, path)
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    def clear(self, endpoint: str | None = None):
+        """
+        Remove all cache entries, or only those of a specific endpoint.
+
+        Args:
+            endpoint (str | None): The endpoint to clear. Defaults to None which
+                clears all endpoints.
+        """
+        directory = (
+            os.path.join(self._directory, endpoint) if endpoint else self._directory
+        )
+
+        for root, _, files in os.walk(directory):
+            for file in files:
+                if file.endswith((".pickle", ".json", ".tmp")):
+                    os.remove(os.path.join(root, file))
+
+
+file_cache = FileCache()
+
+
+def cached(endpoint: str, ttl: int) -> Callable:
+    """
+    Decorator that caches the DataFrame returned by a function on disk. The cache
+    key is based on all arguments of the function except for the API key so that the
+    key itself is never written to disk.
+
+    Args:
+        endpoint (str): The name of the endpoint, used as sub directory of the cache.
+        ttl (int): The amount of seconds the cached data remains valid.
+
+    Returns:
+        Callable: The decorated function.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        signature = inspect.signature(function)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs) -> pd.DataFrame:
+            arguments = signature.bind(*args, **kwargs)
+            arguments.apply_defaults()
+
+            key_arguments = {
+                name: value
+                for name, value in arguments.arguments.items()
+                if name != "api_key"
+            }
+            key = hashlib.sha256(
+                json.dumps(key_arguments, sort_keys=True, default=str).encode()
+            ).hexdigest()
+
+            data = file_cache.load(endpoint, key)
+
+            if data is None:
+                data = function(*args, **kwargs)
+
+                # Empty results, which includes the errors returned by the API such
+                # as reaching the limit, are not cached so they are retried next time
+                if not data.empty:
+                    file_cache.save(endpoint, key, data, ttl)
+
+            return data
+
+        return wrapper
+
+    return decorator
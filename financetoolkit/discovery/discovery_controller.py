@@ -25,6 +25,11 @@ class Discovery:
         """
         Initializes the Discovery Controller Class.
 
+        Note that the results of the list, quote and market endpoints are cached on disk
+        (in ~/.cache/financetoolkit) for a period that depends on how often the data changes,
+        e.g. 30 seconds for quotes and 24 hours for lists. The cache can be cleared with
+        `financetoolkit.discovery.cache_model.file_cache.clear()`.
+
         Args:
             api_key (str): An API key from FinancialModelingPrep. Obtain one here: https://www.jeroenbouma.com/fmp
 
@@ -885,3 +890,37 @@ class Discovery:
         index_quotes = discovery_model.get_index_quotes(api_key=self._api_key)
 
         return index_quotes
+
+    def get_bulk(
+        self, endpoints: list[str], n_workers: int | None = None
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Returns the data of multiple endpoints at once. The API calls are made
+        concurrently so the total duration is roughly that of the slowest endpoint.
+
+        Args:
+            endpoints (list[str]): The endpoints to collect which equal the names of the
+                functions without "get_", e.g. ["stock_quotes", "biggest_gainers"].
+            n_workers (int | None): The maximum amount of endpoints that are collected at
+                the same time. Defaults to None which collects all endpoints at once.
+
+        Returns:
+            dict[str, pd.DataFrame]: A dictionary with the DataFrame of each endpoint.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Discovery
+
+        discovery = Discovery(api_key="FINANCIAL_MODELING_PREP_KEY")
+
+        bulk_data = discovery.get_bulk(["biggest_gainers", "biggest_losers"])
+
+        bulk_data["biggest_gainers"].head(10)
+        ```
+        """
+        bulk_data = discovery_model.get_bulk(
+            api_key=self._api_key, endpoints=endpoints, n_workers=n_workers
+        )
+
+        return bulk_data
@@ -1,37 +1,595 @@
 """Discovery Model"""
 __docformat__ = "google"
 
+import json
+from concurrent.futures import ThreadPoolExecutor
+from io import BufferedReader
+from urllib.parse import quote, urlsplit
+
+import numpy as np
 import pandas as pd
+import requests
+
+from financetoolkit.discovery.cache_model import cached, file_cache
+from financetoolkit.helpers import STREAM_ERRORS, get_financial_data
+
+# The amount of seconds the data of each type of endpoint is cached for
+LIST_TTL = 24 * 60 * 60
+QUOTE_TTL = 30
+SECTORS_PERFORMANCE_TTL = 60 * 60
+MARKET_MOVERS_TTL = 60
+INSTRUMENTS_TTL = 60
+CSV_UNSUPPORTED_TTL = 7 * 24 * 60 * 60
+
+# The session is shared by all endpoints so that the connection to the API, including
+# the TLS handshake, is reused. The pool is large enough for get_bulk to request all
+# endpoints at the same time.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=20)
+)
+
+# The fields that are parsed as dates and how to parse them. The dates are ISO 8601
+# strings which, when specified, are parsed faster than when the format is inferred
+DATE_FIELDS = {"date": {"format": "ISO8601"}, "timestamp": {"unit": "s"}}
+
+# The fields that are read as text from CSV files so that e.g. the symbol "NA" is not
+# seen as missing
+TEXT_FIELDS = [
+    "symbol",
+    "name",
+    "date",
+    "currency",
+    "exchange",
+    "stockExchange",
+    "exchangeShortName",
+    "type",
+]
+
+# The endpoints that turned out to not support the CSV format. These are also stored
+# in the cache so that other processes don't have to find this out again.
+CSV_UNSUPPORTED_ENDPOINTS: set[str] = set()
+
+# Whether to store the prices of the quotes as float32 instead of float64 which halves
+# their memory usage at the cost of precision (about 7 significant digits)
+REDUCE_QUOTE_PRECISION = False
+
+FLOAT32_QUOTE_COLUMNS = [
+    "Price",
+    "Change %",
+    "Change",
+    "Day Low",
+    "Day High",
+    "Year High",
+    "Year Low",
+    "50 Day Avg",
+    "200 Day Avg",
+    "Open",
+    "Previous Close",
+    "EPS",
+    "PE",
+    "Ask Price",
+    "Bid Price",
+    "Last Sale Price",
+]
+
+# The columns that contain a limited amount of distinct values which are therefore
+# stored as categories, e.g. a few hundred exchanges for tens of thousands of stocks
+CATEGORY_COLUMNS = [
+    "Exchange",
+    "Exchange Code",
+    "Currency",
+    "Sector",
+    "Industry",
+    "Country",
+]
+
+# The mappings from the field names of the API to the column names that are shared
+# by multiple endpoints or of which the columns are referred to elsewhere
+SYMBOL_LIST_COLUMNS = {
+    "symbol": "Symbol",
+    "name": "Name",
+    "currency": "Currency",
+    "stockExchange": "Exchange",
+    "exchangeShortName": "Exchange Code",
+}
+PRICE_LIST_COLUMNS = {
+    "symbol": "Symbol",
+    "name": "Name",
+    "price": "Price",
+    "exchange": "Exchange",
+    "exchangeShortName": "Exchange Code",
+    "type": "Type",
+}
+MARKET_MOVERS_COLUMNS = {
+    "symbol": "Symbol",
+    "name": "Name",
+    "change": "Change",
+    "price": "Price",
+    "changesPercentage": "Change %",
+}
+SECTOR_COLUMNS = {
+    "utilitiesChangesPercentage": "Utilities",
+    "basicMaterialsChangesPercentage": "Basic Materials",
+    "communicationServicesChangesPercentage": "Communication Services",
+    "conglomeratesChangesPercentage": "Conglomerates",
+    "consumerCyclicalChangesPercentage": "Consumer Cyclical",
+    "consumerDefensiveChangesPercentage": "Consumer Defensive",
+    "energyChangesPercentage": "Energy",
+    "financialChangesPercentage": "Financial",
+    "financialServicesChangesPercentage": "Financial Services",
+    "healthcareChangesPercentage": "Healthcare",
+    "industrialsChangesPercentage": "Industrials",
+    "realEstateChangesPercentage": "Real Estate",
+    "servicesChangesPercentage": "Services",
+    "technologyChangesPercentage": "Technology",
+}
+QUOTE_COLUMNS = {
+    "symbol": "Symbol",
+    "name": "Name",
+    "price": "Price",
+    "changesPercentage": "Change %",
+    "change": "Change",
+    "dayLow": "Day Low",
+    "dayHigh": "Day High",
+    "yearHigh": "Year High",
+    "yearLow": "Year Low",
+    "marketCap": "Market Cap",
+    "priceAvg50": "50 Day Avg",
+    "priceAvg200": "200 Day Avg",
+    "exchange": "Exchange",
+    "volume": "Volume",
+    "avgVolume": "Avg Volume",
+    "open": "Open",
+    "previousClose": "Previous Close",
+    "eps": "EPS",
+    "pe": "PE",
+    "earningsAnnouncement": "Earnings Announcement",
+    "sharesOutstanding": "Shares Outstanding",
+    "timestamp": "Timestamp",
+}
+# Which quote columns are empty depends on the asset class, e.g. the earnings per share
+# and the volume are not available for currencies, thus every column is left out when
+# empty. The check stops at the first value so this is only costly for empty columns.
+OPTIONAL_QUOTE_COLUMNS = [
+    column for column in QUOTE_COLUMNS.values() if column != "Symbol"
+]
+STOCK_QUOTE_COLUMNS = {
+    "symbol": "Symbol",
+    "askPrice": "Ask Price",
+    "volume": "Volume",
+    "askSize": "Ask Size",
+    "bidPrice": "Bid Price",
+    "lastSalePrice": "Last Sale Price",
+    "lastSaleSize": "Last Sale Size",
+    "lastSaleTime": "Last Sale Time",
+}
+
+# The definition of the quote endpoints which only differ in their path and columns
+QUOTE_ENDPOINTS: dict[str, dict] = {
+    "stock": {
+        "path": "stock/full/real-time-price",
+        "column_mapping": STOCK_QUOTE_COLUMNS,
+        "drop_columns": ["fmpLast", "lastUpdated"],
+        "optional_columns": None,
+    },
+    **{
+        asset_class: {
+            "path": f"quotes/{asset_class}",
+            "column_mapping": QUOTE_COLUMNS,
+            "drop_columns": ["Exchange"],
+            "optional_columns": OPTIONAL_QUOTE_COLUMNS,
+        }
+        for asset_class in ["crypto", "forex", "commodity", "index"]
+    },
+}
+
+
+def get_discovery_data(
+    url: str,
+    column_mapping: dict[str, str],
+    drop_columns: list[str] | None = None,
+    index_column: str = "Symbol",
+    record_filter: dict[str, str] | None = None,
+    optional_columns: list[str] | None = None,
+    as_index: bool = True,
+    sort_index: bool = True,
+    stream: bool = False,
+    csv: bool = False,
+) -> pd.DataFrame:
+    """
+    Collect the data of an endpoint and convert it into a DataFrame.
 
-from financetoolkit.helpers import get_financial_data
+    Rather than creating a DataFrame from the records and then renaming, filtering
+    and dropping columns, which copies the data each time, the records are directly
+    converted into columns with their final names. Dropped columns and filtered
+    rows are therefore never created in the first place.
 
+    Args:
+        url (str): The url to retrieve the data from.
+        column_mapping (dict[str, str]): The mapping from the field names of the API
+            to the column names.
+        drop_columns (list[str] | None): The columns to exclude. Defaults to None.
+        index_column (str): The column to use as index. Defaults to "Symbol".
+        record_filter (dict[str, str] | None): Only keep the records of which the field
+            equals the value, e.g. {"type": "stock"}. Defaults to None.
+        optional_columns (list[str] | None): The columns that are excluded when they
+            contain no values at all, e.g. the earnings of a currency. Defaults to None.
+        as_index (bool): Whether to set the index column as index. When False, the
+            index column is kept as a regular column. Defaults to True.
+        sort_index (bool): Whether to sort by the index column. Defaults to True.
+        stream (bool): Whether to process the records while they are being downloaded
+            which lowers the memory usage for large endpoints. Requires ijson to be
+            installed. Defaults to False.
+        csv (bool): Whether to collect the data in CSV format which is parsed faster
+            than JSON. Only the fields in the column mapping are read and the JSON
+            format is used when the endpoint doesn't support CSV. Defaults to False.
 
-def get_instruments(api_key: str, query: str) -> pd.DataFrame:
+    Returns:
+        pd.DataFrame: DataFrame with the data of the endpoint.
     """
-    Get a list of instruments based on a query.
+    drop_columns = drop_columns or []
+    record_filter = record_filter or {}
+
+    columns = (
+        get_discovery_csv_columns(
+            url=url,
+            column_mapping=column_mapping,
+            drop_columns=drop_columns,
+            record_filter=record_filter,
+        )
+        if csv
+        else None
+    )
+
+    if columns is None:
+        records = get_financial_data(url=url, raw=True, stream=stream, session=SESSION)
+
+        if isinstance(records, pd.DataFrame):
+            # The API returned an error which is reported through the columns
+            return records
+
+        if isinstance(records, dict) and "Error Message" in records:
+            raise ValueError(
+                f"The API returned an error for {urlsplit(url).path}: "
+                f"{records['Error Message']}"
+            )
+
+        if isinstance(records, dict):
+            raise ValueError(
+                f"Expected a list of records from {urlsplit(url).path} but "
+                f"received: {records}"
+            )
+
+        # The records are converted into columns in a single pass so that the records
+        # can also be processed while they are being downloaded
+        field_values: dict[str, list] = {}
+        excluded_fields: set[str] = set()
+        record_count = 0
+
+        try:
+            for record in records:
+                if any(
+                    record.get(field) != value for field, value in record_filter.items()
+                ):
+                    continue
+
+                for field in record:
+                    if field not in field_values and field not in excluded_fields:
+                        if column_mapping.get(field, field) in drop_columns:
+                            excluded_fields.add(field)
+                        else:
+                            field_values[field] = [None] * record_count
+
+                for field, values in field_values.items():
+                    values.append(record.get(field))
+
+                record_count += 1
+        except STREAM_ERRORS:
+            if not stream:
+                raise
+
+            # The stream was interrupted or malformed, the data is therefore collected
+            # again at once so that any errors go through the regular error handling
+            return get_discovery_data(
+                url=url,
+                column_mapping=column_mapping,
+                drop_columns=drop_columns,
+                index_column=index_column,
+                record_filter=record_filter,
+                optional_columns=optional_columns,
+                as_index=as_index,
+                sort_index=sort_index,
+            )
+
+        columns = {
+            column_mapping.get(field, field): values
+            for field, values in field_values.items()
+        }
+
+        # Release the records, which take up more memory than the columns themselves,
+        # before the DataFrame is created instead of at the end of the function
+        del records, field_values
+
+    record_count = len(next(iter(columns.values()), []))
+
+    if optional_columns:
+        # Only the columns that are known to be empty for some instruments are checked
+        # and this is done before creating the DataFrame so that they are never added
+        columns = {
+            column: values
+            for column, values in columns.items()
+            if column not in optional_columns
+            or any(pd.notna(value) for value in values)
+        }
+
+    for field, date_options in DATE_FIELDS.items():
+        column = column_mapping.get(field, field)
+
+        if column in columns:
+            columns[column] = pd.to_datetime(columns[column], **date_options)
+
+    for column in CATEGORY_COLUMNS:
+        if column in columns and column != index_column:
+            columns[column] = pd.Categorical(columns[column])
+
+    if not record_count:
+        columns = {
+            column: []
+            for column in dict.fromkeys(column_mapping.values())
+            if column not in drop_columns
+        }
+
+    index = (
+        pd.Index(columns.pop(index_column, []), name=index_column) if as_index else None
+    )
+
+    discovery_data = pd.DataFrame(columns, index=index)
+
+    # The DataFrame holds its own copy of the data so the lists are no longer needed
+    # and are released before sorting creates yet another copy
+    del columns, index
+
+    if sort_index and (as_index or index_column in discovery_data.columns):
+        sort_values = discovery_data.index if as_index else discovery_data[index_column]
+
+        try:
+            # Sorting the positions directly avoids the overhead of sort_index
+            order = np.argsort(sort_values.to_numpy(), kind="stable")
+            discovery_data = discovery_data.iloc[order]
+        except TypeError:
+            # Occurs when the values contain missing values next to strings
+            discovery_data = (
+                discovery_data.sort_index()
+                if as_index
+                else discovery_data.sort_values(index_column)
+            )
+
+        if not as_index:
+            discovery_data.index = pd.RangeIndex(len(discovery_data))
+
+    return discovery_data
+
+
+def get_discovery_csv_columns(
+    url: str,
+    column_mapping: dict[str, str],
+    drop_columns: list[str],
+    record_filter: dict[str, str],
+) -> dict[str, np.ndarray] | None:
+    """
+    Collect the data of an endpoint in CSV format and convert it into columns. Only
+    the fields in the column mapping are parsed, which is done by the C parser of pandas.
+
+    Args:
+        url (str): The url to retrieve the data from.
+        column_mapping (dict[str, str]): The mapping from the field names of the API
+            to the column names.
+        drop_columns (list[str]): The columns to exclude.
+        record_filter (dict[str, str]): Only keep the records of which the field
+            equals the value, e.g. {"type": "stock"}.
+
+    Returns:
+        dict[str, np.ndarray] | None: The values of each column or None when the data
+            could not be collected in CSV format.
+    """
+    endpoint = urlsplit(url).path
+    cache_key = endpoint.strip("/").replace("/", "_")
+
+    if endpoint in CSV_UNSUPPORTED_ENDPOINTS:
+        return None
+
+    if file_cache.load("csv_unsupported", cache_key) is not None:
+        CSV_UNSUPPORTED_ENDPOINTS.add(endpoint)
+
+        return None
+
+    fields = [
+        field
+        for field, column in column_mapping.items()
+        if column not in drop_columns or field in record_filter
+    ]
+
+    try:
+        with SESSION.get(f"{url}&datatype=csv", timeout=60, stream=True) as response:
+            response.raise_for_status()
+
+            # The data is parsed while it is being downloaded, after checking the
+            # start of the response so that JSON responses are not downloaded in full
+            response.raw.decode_content = True
+            stream_reader = BufferedReader(response.raw)
+            start = stream_reader.peek().lstrip()[:1]
+
+            if start == b"{":
+                error = json.loads(stream_reader.read())
+
+                if isinstance(error, dict) and "Error Message" in error:
+                    # E.g. reaching the limit, which says nothing about the support
+                    # of the CSV format and is handled by the regular JSON request
+                    return None
+
+                raise ValueError("The response is a JSON object instead of CSV.")
+
+            if start == b"[":
+                raise ValueError("The response is a JSON list instead of CSV.")
+
+            csv_data = pd.read_csv(
+                stream_reader,
+                usecols=fields,
+                # Prevents symbols such as "NA" or "2330" from becoming missing or numeric
+                dtype={field: str for field in fields if field in TEXT_FIELDS},
+                keep_default_na=False,
+                na_values=[""],
+            )
+    except ValueError:
+        # The response is not a CSV file with the expected fields
+        CSV_UNSUPPORTED_ENDPOINTS.add(endpoint)
+        file_cache.save(
+            "csv_unsupported",
+            cache_key,
+            pd.DataFrame({"Endpoint": [endpoint]}),
+            CSV_UNSUPPORTED_TTL,
+        )
+
+        return None
+    except STREAM_ERRORS:
+        # E.g. an interrupted connection, which is retried by the regular JSON request
+        return None
+
+    for field, value in record_filter.items():
+        csv_data = csv_data[csv_data[field] == value]
+
+    columns = {
+        column_mapping[field]: csv_data[field].to_numpy()
+        for field in csv_data.columns
+        if column_mapping[field] not in drop_columns
+    }
+
+    return columns
+
+
+def get_quotes(
+    api_key: str, asset_class: str, as_index: bool = True, sort: bool = True
+) -> pd.DataFrame:
+    """
+    Get the quotes for all instruments of an asset class. All quote endpoints are
+    collected this way based on their definition in QUOTE_ENDPOINTS.
+
+    The precision is reduced, when REDUCE_QUOTE_PRECISION is enabled, after the quotes
+    are loaded from the cache so that the cached quotes don't depend on this setting.
 
     Args:
         api_key (str): the API key from Financial Modeling Prep.
-        query (str): The query to search for.
+        asset_class (str): The asset class, e.g. "stock", "crypto" or "index".
+        as_index (bool): Whether to set the symbol as index. Defaults to True.
+        sort (bool): Whether to sort by the symbol. Defaults to True.
 
     Returns:
-        pd.DataFrame: DataFrame of instruments.
+        pd.DataFrame: DataFrame of quotes.
     """
-    url = f"https://financialmodelingprep.com/api/v3/search?query={query}&apikey={api_key}"
+    quotes = collect_quotes(
+        api_key=api_key, asset_class=asset_class, as_index=as_index, sort=sort
+    )
 
-    instruments_query = get_financial_data(url=url)
+    if REDUCE_QUOTE_PRECISION:
+        quotes = reduce_quote_precision(quotes)
 
-    instruments_query = instruments_query.rename(
-        columns={
-            "symbol": "Symbol",
-            "name": "Name",
-            "currency": "Currency",
-            "stockExchange": "Exchange",
-            "exchangeShortName": "Exchange Code",
-        }
+    return quotes
+
+
+@cached(endpoint="quotes", ttl=QUOTE_TTL)
+def collect_quotes(
+    api_key: str, asset_class: str, as_index: bool = True, sort: bool = True
+) -> pd.DataFrame:
+    """
+    Collect the quotes for all instruments of an asset class from the API.
+
+    Args:
+        api_key (str): the API key from Financial Modeling Prep.
+        asset_class (str): The asset class, e.g. "stock", "crypto" or "index".
+        as_index (bool): Whether to set the symbol as index. Defaults to True.
+        sort (bool): Whether to sort by the symbol. Defaults to True.
+
+    Returns:
+        pd.DataFrame: DataFrame of quotes.
+    """
+    if asset_class not in QUOTE_ENDPOINTS:
+        raise ValueError(
+            f"The asset class {asset_class} is not available. "
+            f"Choose from: {', '.join(QUOTE_ENDPOINTS)}"
+        )
+
+    quote_endpoint = QUOTE_ENDPOINTS[asset_class]
+
+    url = f"https://financialmodelingprep.com/api/v3/{quote_endpoint['path']}?apikey={api_key}"
+
+    quotes = get_discovery_data(
+        url=url,
+        as_index=as_index,
+        sort_index=sort,
+        column_mapping=quote_endpoint["column_mapping"],
+        drop_columns=quote_endpoint["drop_columns"],
+        optional_columns=quote_endpoint["optional_columns"],
     )
 
-    instruments_query = instruments_query.set_index("Symbol")
+    return quotes
+
+
+def reduce_quote_precision(quotes: pd.DataFrame) -> pd.DataFrame:
+    """
+    Reduce the precision of the quotes to lower their memory usage. The prices are
+    stored as float32 and the average volume as int32 if it fits. The market cap, volume
+    and shares outstanding are kept as is given that they can exceed the int32 range.
+
+    Args:
+        quotes (pd.DataFrame): The quotes as returned by the API.
+
+    Returns:
+        pd.DataFrame: The quotes with the reduced precision.
+    """
+    reduced_columns = {
+        column: quotes[column].astype(np.float32)
+        for column in FLOAT32_QUOTE_COLUMNS
+        if column in quotes
+    }
+
+    if "Avg Volume" in quotes:
+        average_volume = quotes["Avg Volume"]
+
+        if (
+            average_volume.notna().all()
+            and average_volume.abs().max() <= np.iinfo(np.int32).max
+        ):
+            reduced_columns["Avg Volume"] = average_volume.astype(np.int32)
+
+    return quotes.assign(**reduced_columns)
+
+
+@cached(endpoint="instruments", ttl=INSTRUMENTS_TTL)
+def get_instruments(
+    api_key: str, query: str, as_index: bool = True, sort: bool = False
+) -> pd.DataFrame:
+    """
+    Get a list of instruments based on a query.
+
+    Args:
+        api_key (str): the API key from Financial Modeling Prep.
+        query (str): The query to search for.
+        as_index (bool): Whether to set the symbol as index. Defaults to True.
+        sort (bool): Whether to sort by the symbol. Defaults to False.
+
+    Returns:
+        pd.DataFrame: DataFrame of instruments.
+    """
+    # Encode the query so that characters such as "&" and "#" don't break the URL
+    url = f"https://financialmodelingprep.com/api/v3/search?query={quote(query, safe='')}&apikey={api_key}"
+
+    instruments_query = get_discovery_data(
+        url=url,
+        as_index=as_index,
+        sort_index=sort,
+        column_mapping=SYMBOL_LIST_COLUMNS,
+    )
 
     return instruments_query
 
@@ -49,6 +607,8 @@ def get_stock_screener(
     dividend_higher: int | None = None,
     dividend_lower: int | None = None,
     is_etf: bool | None = None,
+    as_index: bool = True,
+    sort: bool = False,
 ) -> pd.DataFrame:
     """
     Get a list of instruments based on the screening criteria provided. It defaults
@@ -67,6 +627,8 @@ def get_stock_screener(
         dividend_higher (int, optional): The dividend higher than. Defaults to None.
         dividend_lower (int, optional): The dividend lower than. Defaults to None.
         is_etf (bool, optional): Whether the instrument is an ETF. Defaults to None.
+        as_index (bool): Whether to set the symbol as index. Defaults to True.
+        sort (bool): Whether to sort by the symbol. Defaults to False.
 
     Returns:
         pd.DataFrame: DataFrame of instruments matching the query.
@@ -96,10 +658,11 @@ def get_stock_screener(
     if is_etf is not None:
         url += f"&isEtf={str(is_etf)}"
 
-    stock_screener = get_financial_data(url=url)
-
-    stock_screener = stock_screener.rename(
-        columns={
+    stock_screener = get_discovery_data(
+        url=url,
+        as_index=as_index,
+        sort_index=sort,
+        column_mapping={
             "symbol": "Symbol",
             "companyName": "Name",
             "marketCap": "Market Cap",
@@ -114,195 +677,182 @@ def get_stock_screener(
             "country": "Country",
             "currency": "Currency",
             "stockExchange": "Exchange",
-        }
+        },
+        drop_columns=["isEtf", "isActivelyTrading"],
     )
 
     if stock_screener.empty:
         raise ValueError("No stocks found matching the query.")
 
-    stock_screener = stock_screener.drop(columns=["isEtf", "isActivelyTrading"])
-    stock_screener = stock_screener.set_index("Symbol")
-
     return stock_screener
 
 
-def get_stock_list(api_key: str) -> pd.DataFrame:
+@cached(endpoint="stock_list", ttl=LIST_TTL)
+def get_stock_list(
+    api_key: str, as_index: bool = True, sort: bool = True
+) -> pd.DataFrame:
     """
     Get a list of stocks.
 
     Args:
         api_key (str): the API key from Financial Modeling Prep.
+        as_index (bool): Whether to set the symbol as index. Defaults to True.
+        sort (bool): Whether to sort by the symbol. Defaults to True.
 
     Returns:
         pd.DataFrame: DataFrame of stocks.
     """
     url = f"https://financialmodelingprep.com/api/v3/stock/list?apikey={api_key}"
 
-    stock_list = get_financial_data(url=url)
-
-    stock_list = stock_list.rename(
-        columns={
-            "symbol": "Symbol",
-            "name": "Name",
-            "price": "Price",
-            "exchange": "Exchange",
-            "exchangeShortName": "Exchange Code",
-            "type": "Type",
-        }
+    stock_list = get_discovery_data(
+        url=url,
+        as_index=as_index,
+        sort_index=sort,
+        column_mapping=PRICE_LIST_COLUMNS,
+        drop_columns=["Type"],
+        record_filter={"type": "stock"},
+        stream=True,
+        csv=True,
     )
 
-    stock_list = stock_list[stock_list["Type"] == "stock"]
-
-    stock_list = stock_list.drop(columns=["Type"])
-
-    stock_list = stock_list.set_index("Symbol").sort_index()
-
     return stock_list
 
 
-def get_stock_quotes(api_key: str) -> pd.DataFrame:
+def get_stock_quotes(
+    api_key: str, as_index: bool = True, sort: bool = True
+) -> pd.DataFrame:
     """
     Get the quotes for all stocks.
 
     Args:
         api_key (str): the API key from Financial Modeling Prep.
+        as_index (bool): Whether to set the symbol as index. Defaults to True.
+        sort (bool): Whether to sort by the symbol. Defaults to True.
 
     Returns:
         pd.DataFrame: DataFrame of stock quotes.
     """
-    url = f"https://financialmodelingprep.com/api/v3/stock/full/real-time-price?apikey={api_key}"
-
-    stock_quotes = get_financial_data(url=url)
-
-    stock_quotes = stock_quotes.rename(
-        columns={
-            "symbol": "Symbol",
-            "askPrice": "Ask Price",
-            "volume": "Volume",
-            "askSize": "Ask Size",
-            "bidPrice": "Bid Price",
-            "lastSalePrice": "Last Sale Price",
-            "lastSaleSize": "Last Sale Size",
-            "lastSaleTime": "Last Sale Time",
-        }
+    stock_quotes = get_quotes(
+        api_key=api_key, asset_class="stock", as_index=as_index, sort=sort
     )
 
-    stock_quotes = stock_quotes.drop(columns=["fmpLast", "lastUpdated"])
-
-    stock_quotes = stock_quotes.set_index("Symbol").sort_index()
-
     return stock_quotes
 
 
-def get_stock_shares_float(api_key: str) -> pd.DataFrame:
+@cached(endpoint="stock_shares_float", ttl=LIST_TTL)
+def get_stock_shares_float(
+    api_key: str, as_index: bool = True, sort: bool = True
+) -> pd.DataFrame:
     """
     Get the shares float for all stocks.
 
     Args:
         api_key (str): the API key from Financial Modeling Prep.
+        as_index (bool): Whether to set the symbol as index. Defaults to True.
+        sort (bool): Whether to sort by the symbol. Defaults to True.
 
     Returns:
         pd.DataFrame: DataFrame of shares float.
     """
     url = f"https://financialmodelingprep.com/api/v4/shares_float/all?apikey={api_key}"
 
-    stock_shares_float = get_financial_data(url=url)
-
-    stock_shares_float = stock_shares_float.rename(
-        columns={
+    stock_shares_float = get_discovery_data(
+        url=url,
+        as_index=as_index,
+        sort_index=sort,
+        column_mapping={
             "symbol": "Symbol",
             "date": "Date",
             "freeFloat": "Free Float",
             "floatShares": "Float Shares",
             "outstandingShares": "Outstanding Shares",
-        }
+        },
+        stream=True,
+        csv=True,
     )
 
-    stock_shares_float = stock_shares_float.set_index("Symbol").sort_index()
+    # The API returns the amount of shares as strings
+    for column in ["Float Shares", "Outstanding Shares"]:
+        stock_shares_float[column] = pd.to_numeric(
+            stock_shares_float[column], errors="coerce"
+        )
 
     return stock_shares_float
 
 
-def get_sectors_performance(api_key: str) -> pd.DataFrame:
+@cached(endpoint="sectors_performance", ttl=SECTORS_PERFORMANCE_TTL)
+def get_sectors_performance(
+    api_key: str, as_index: bool = True, sort: bool = True
+) -> pd.DataFrame:
     """
     Get the sectors performance.
 
     Args:
         api_key (str): the API key from Financial Modeling Prep.
+        as_index (bool): Whether to set the date as index. Defaults to True.
+        sort (bool): Whether to sort by the date. Defaults to True.
 
     Returns:
         pd.DataFrame: DataFrame of sectors performance.
     """
     url = f"https://financialmodelingprep.com/api/v3/historical-sectors-performance?apikey={api_key}"
 
-    sectors_performance = get_financial_data(url=url)
-
-    sectors_performance = sectors_performance.rename(
-        columns={
-            "date": "Date",
-            "utilitiesChangesPercentage": "Utilities",
-            "basicMaterialsChangesPercentage": "Basic Materials",
-            "communicationServicesChangesPercentage": "Communication Services",
-            "conglomeratesChangesPercentage": "Conglomerates",
-            "consumerCyclicalChangesPercentage": "Consumer Cyclical",
-            "consumerDefensiveChangesPercentage": "Consumer Defensive",
-            "energyChangesPercentage": "Energy",
-            "financialChangesPercentage": "Financial",
-            "financialServicesChangesPercentage": "Financial Services",
-            "healthcareChangesPercentage": "Healthcare",
-            "industrialsChangesPercentage": "Industrials",
-            "realEstateChangesPercentage": "Real Estate",
-            "servicesChangesPercentage": "Services",
-            "technologyChangesPercentage": "Technology",
-        }
+    sectors_performance = get_discovery_data(
+        url=url,
+        as_index=as_index,
+        sort_index=sort,
+        column_mapping={"date": "Date", **SECTOR_COLUMNS},
+        index_column="Date",
+        optional_columns=list(SECTOR_COLUMNS.values()),
     )
 
-    sectors_performance = sectors_performance.set_index("Date")
-
-    sectors_performance.index = pd.PeriodIndex(sectors_performance.index, freq="D")
-
-    sectors_performance = sectors_performance.sort_index()
-
-    sectors_performance = sectors_performance.dropna(how="all", axis=1)
+    # The dates are already parsed and sorted so they only need to be converted
+    if as_index:
+        sectors_performance.index = sectors_performance.index.to_period(freq="D")
+    else:
+        sectors_performance["Date"] = sectors_performance["Date"].dt.to_period(freq="D")
 
     return sectors_performance
 
 
-def get_biggest_gainers(api_key: str) -> pd.DataFrame:
+@cached(endpoint="biggest_gainers", ttl=MARKET_MOVERS_TTL)
+def get_biggest_gainers(
+    api_key: str, as_index: bool = True, sort: bool = True
+) -> pd.DataFrame:
     """
     Get the biggest gainers.
 
     Args:
         api_key (str): the API key from Financial Modeling Prep.
+        as_index (bool): Whether to set the symbol as index. Defaults to True.
+        sort (bool): Whether to sort by the symbol. Defaults to True.
 
     Returns:
         pd.DataFrame: DataFrame of biggest gainers.
     """
     url = f"https://financialmodelingprep.com/api/v3/stock_market/gainers?apikey={api_key}"
 
-    biggest_gainers = get_financial_data(url=url)
-
-    biggest_gainers = biggest_gainers.rename(
-        columns={
-            "symbol": "Symbol",
-            "name": "Name",
-            "change": "Change",
-            "price": "Price",
-            "changesPercentage": "Change %",
-        }
+    biggest_gainers = get_discovery_data(
+        url=url,
+        as_index=as_index,
+        sort_index=sort,
+        column_mapping=MARKET_MOVERS_COLUMNS,
     )
 
-    biggest_gainers = biggest_gainers.set_index("Symbol").sort_index()
-
     return biggest_gainers
 
 
-def get_biggest_losers(api_key: str) -> pd.DataFrame:
+@cached(endpoint="biggest_losers", ttl=MARKET_MOVERS_TTL)
+def get_biggest_losers(
+    api_key: str, as_index: bool = True, sort: bool = True
+) -> pd.DataFrame:
     """
     Get the biggest losers.
 
     Args:
         api_key (str): the API key from Financial Modeling Prep.
+        as_index (bool): Whether to set the symbol as index. Defaults to True.
+        sort (bool): Whether to sort by the symbol. Defaults to True.
 
     Returns:
         pd.DataFrame: DataFrame of biggest losers.
@@ -311,89 +861,82 @@ def get_biggest_losers(api_key: str) -> pd.DataFrame:
         f"https://financialmodelingprep.com/api/v3/stock_market/losers?apikey={api_key}"
     )
 
-    biggest_losers = get_financial_data(url=url)
-
-    biggest_losers = biggest_losers.rename(
-        columns={
-            "symbol": "Symbol",
-            "name": "Name",
-            "change": "Change",
-            "price": "Price",
-            "changesPercentage": "Change %",
-        }
+    biggest_losers = get_discovery_data(
+        url=url,
+        as_index=as_index,
+        sort_index=sort,
+        column_mapping=MARKET_MOVERS_COLUMNS,
     )
 
-    biggest_losers = biggest_losers.set_index("Symbol").sort_index()
-
     return biggest_losers
 
 
-def get_most_active_stocks(api_key: str) -> pd.DataFrame:
+@cached(endpoint="most_active_stocks", ttl=MARKET_MOVERS_TTL)
+def get_most_active_stocks(
+    api_key: str, as_index: bool = True, sort: bool = True
+) -> pd.DataFrame:
     """
     Get the most active stocks.
 
     Args:
         api_key (str): the API key from Financial Modeling Prep.
+        as_index (bool): Whether to set the symbol as index. Defaults to True.
+        sort (bool): Whether to sort by the symbol. Defaults to True.
 
     Returns:
         pd.DataFrame: DataFrame of most active stocks.
     """
     url = f"https://financialmodelingprep.com/api/v3/stock_market/actives?apikey={api_key}"
 
-    most_active = get_financial_data(url=url)
-
-    most_active = most_active.rename(
-        columns={
-            "symbol": "Symbol",
-            "name": "Name",
-            "change": "Change",
-            "price": "Price",
-            "changesPercentage": "Change %",
-        }
+    most_active = get_discovery_data(
+        url=url,
+        as_index=as_index,
+        sort_index=sort,
+        column_mapping=MARKET_MOVERS_COLUMNS,
     )
 
-    most_active = most_active.set_index("Symbol").sort_index()
-
     return most_active
 
 
-def get_crypto_list(api_key: str) -> pd.DataFrame:
+@cached(endpoint="crypto_list", ttl=LIST_TTL)
+def get_crypto_list(
+    api_key: str, as_index: bool = True, sort: bool = True
+) -> pd.DataFrame:
     """
     Get a list of cryptocurrencies.
 
     Args:
         api_key (str): the API key from Financial Modeling Prep.
+        as_index (bool): Whether to set the symbol as index. Defaults to True.
+        sort (bool): Whether to sort by the symbol. Defaults to True.
 
     Returns:
         pd.DataFrame: DataFrame of cryptocurrencies.
     """
     url = f"https://financialmodelingprep.com/api/v3/symbol/available-cryptocurrencies?apikey={api_key}"
 
-    crypto_list = get_financial_data(url=url)
-
-    crypto_list = crypto_list.rename(
-        columns={
-            "symbol": "Symbol",
-            "name": "Name",
-            "currency": "Currency",
-            "stockExchange": "Exchange",
-            "exchangeShortName": "Exchange Code",
-        }
+    crypto_list = get_discovery_data(
+        url=url,
+        as_index=as_index,
+        sort_index=sort,
+        column_mapping=SYMBOL_LIST_COLUMNS,
+        drop_columns=["Exchange Code"],
     )
 
-    crypto_list = crypto_list.drop(columns=["Exchange Code"])
-
-    crypto_list = crypto_list.set_index("Symbol").sort_index()
-
     return crypto_list
 
 
-def get_delisted_stocks(api_key: str) -> pd.DataFrame:
+@cached(endpoint="delisted_stocks", ttl=LIST_TTL)
+def get_delisted_stocks(
+    api_key: str, as_index: bool = True, sort: bool = True
+) -> pd.DataFrame:
     """
     Get a list of delisted companies.
 
     Args:
         api_key (str): the API key from Financial Modeling Prep.
+        as_index (bool): Whether to set the symbol as index. Defaults to True.
+        sort (bool): Whether to sort by the symbol. Defaults to True.
 
     Returns:
         pd.DataFrame: DataFrame of delisted companies.
@@ -402,343 +945,291 @@ def get_delisted_stocks(api_key: str) -> pd.DataFrame:
         f"https://financialmodelingprep.com/api/v3/delisted-companies?apikey={api_key}"
     )
 
-    delisted_companies = get_financial_data(url=url)
-
-    delisted_companies = delisted_companies.rename(
-        columns={
+    delisted_companies = get_discovery_data(
+        url=url,
+        as_index=as_index,
+        sort_index=sort,
+        column_mapping={
             "symbol": "Symbol",
             "companyName": "Name",
             "exchange": "Exchange",
             "ipoDate": "IPO Date",
             "delistedDate": "Delisted Date",
-        }
+        },
     )
 
-    delisted_companies = delisted_companies.set_index("Symbol").sort_index()
-
     return delisted_companies
 
 
-def get_crypto_quotes(api_key: str) -> pd.DataFrame:
+def get_crypto_quotes(
+    api_key: str, as_index: bool = True, sort: bool = True
+) -> pd.DataFrame:
     """
     Get the quotes for all cryptocurrencies.
 
     Args:
         api_key (str): the API key from Financial Modeling Prep.
+        as_index (bool): Whether to set the symbol as index. Defaults to True.
+        sort (bool): Whether to sort by the symbol. Defaults to True.
 
     Returns:
         pd.DataFrame: DataFrame of crypto quotes.
     """
-    url = f"https://financialmodelingprep.com/api/v3/quotes/crypto?apikey={api_key}"
-
-    crypto_quotes = get_financial_data(url=url)
-
-    crypto_quotes = crypto_quotes.rename(
-        columns={
-            "symbol": "Symbol",
-            "name": "Name",
-            "price": "Price",
-            "changesPercentage": "Change %",
-            "change": "Change",
-            "dayLow": "Day Low",
-            "dayHigh": "Day High",
-            "yearHigh": "Year High",
-            "yearLow": "Year Low",
-            "marketCap": "Market Cap",
-            "priceAvg50": "50 Day Avg",
-            "priceAvg200": "200 Day Avg",
-            "exchange": "Exchange",
-            "volume": "Volume",
-            "avgVolume": "Avg Volume",
-            "open": "Open",
-            "previousClose": "Previous Close",
-            "eps": "EPS",
-            "pe": "PE",
-            "earningsAnnouncement": "Earnings Announcement",
-            "sharesOutstanding": "Shares Outstanding",
-            "timestamp": "Timestamp",
-        }
+    crypto_quotes = get_quotes(
+        api_key=api_key, asset_class="crypto", as_index=as_index, sort=sort
     )
 
-    crypto_quotes = crypto_quotes.drop(columns=["Exchange"])
-
-    crypto_quotes = crypto_quotes.set_index("Symbol").sort_index()
-
-    crypto_quotes = crypto_quotes.dropna(how="all", axis=1)
-
     return crypto_quotes
 
 
-def get_forex_list(api_key: str) -> pd.DataFrame:
+@cached(endpoint="forex_list", ttl=LIST_TTL)
+def get_forex_list(
+    api_key: str, as_index: bool = True, sort: bool = True
+) -> pd.DataFrame:
     """
     Get a list of forex pairs.
 
     Args:
         api_key (str): the API key from Financial Modeling Prep.
+        as_index (bool): Whether to set the symbol as index. Defaults to True.
+        sort (bool): Whether to sort by the symbol. Defaults to True.
 
     Returns:
         pd.DataFrame: DataFrame of forex pairs.
     """
     url = f"https://financialmodelingprep.com/api/v3/symbol/available-forex-currency-pairs?apikey={api_key}"
 
-    forex_list = get_financial_data(url=url)
-
-    forex_list = forex_list.rename(
-        columns={
-            "symbol": "Symbol",
-            "name": "Name",
-            "currency": "Currency",
-            "stockExchange": "Exchange",
-            "exchangeShortName": "Exchange Code",
-        }
+    forex_list = get_discovery_data(
+        url=url,
+        as_index=as_index,
+        sort_index=sort,
+        column_mapping=SYMBOL_LIST_COLUMNS,
+        drop_columns=["Exchange Code"],
     )
 
-    forex_list = forex_list.drop(columns=["Exchange Code"])
-
-    forex_list = forex_list.set_index("Symbol").sort_index()
-
     return forex_list
 
 
-def get_forex_quotes(api_key: str) -> pd.DataFrame:
+def get_forex_quotes(
+    api_key: str, as_index: bool = True, sort: bool = True
+) -> pd.DataFrame:
     """
     Get the quotes for all forex pairs.
 
     Args:
         api_key (str): the API key from Financial Modeling Prep.
+        as_index (bool): Whether to set the symbol as index. Defaults to True.
+        sort (bool): Whether to sort by the symbol. Defaults to True.
 
     Returns:
         pd.DataFrame: DataFrame of forex quotes.
     """
-    url = f"https://financialmodelingprep.com/api/v3/quotes/forex?apikey={api_key}"
-
-    forex_quotes = get_financial_data(url=url)
-
-    forex_quotes = forex_quotes.rename(
-        columns={
-            "symbol": "Symbol",
-            "name": "Name",
-            "price": "Price",
-            "changesPercentage": "Change %",
-            "change": "Change",
-            "dayLow": "Day Low",
-            "dayHigh": "Day High",
-            "yearHigh": "Year High",
-            "yearLow": "Year Low",
-            "marketCap": "Market Cap",
-            "priceAvg50": "50 Day Avg",
-            "priceAvg200": "200 Day Avg",
-            "exchange": "Exchange",
-            "volume": "Volume",
-            "avgVolume": "Avg Volume",
-            "open": "Open",
-            "previousClose": "Previous Close",
-            "eps": "EPS",
-            "pe": "PE",
-            "earningsAnnouncement": "Earnings Announcement",
-            "sharesOutstanding": "Shares Outstanding",
-            "timestamp": "Timestamp",
-        }
+    forex_quotes = get_quotes(
+        api_key=api_key, asset_class="forex", as_index=as_index, sort=sort
     )
 
-    forex_quotes = forex_quotes.drop(columns=["Exchange"])
-
-    forex_quotes = forex_quotes.set_index("Symbol").sort_index()
-
-    forex_quotes = forex_quotes.dropna(how="all", axis=1)
-
     return forex_quotes
 
 
-def get_commodity_list(api_key: str) -> pd.DataFrame:
+@cached(endpoint="commodity_list", ttl=LIST_TTL)
+def get_commodity_list(
+    api_key: str, as_index: bool = True, sort: bool = True
+) -> pd.DataFrame:
     """
     Get a list of commodities.
 
     Args:
         api_key (str): the API key from Financial Modeling Prep.
+        as_index (bool): Whether to set the symbol as index. Defaults to True.
+        sort (bool): Whether to sort by the symbol. Defaults to True.
 
     Returns:
         pd.DataFrame: DataFrame of commodities.
     """
     url = f"https://financialmodelingprep.com/api/v3/symbol/available-commodities?apikey={api_key}"
 
-    commody_list = get_financial_data(url=url)
-
-    commody_list = commody_list.rename(
-        columns={
-            "symbol": "Symbol",
-            "name": "Name",
-            "currency": "Currency",
-            "stockExchange": "Exchange",
-            "exchangeShortName": "Exchange Code",
-        }
+    commody_list = get_discovery_data(
+        url=url,
+        as_index=as_index,
+        sort_index=sort,
+        column_mapping=SYMBOL_LIST_COLUMNS,
+        drop_columns=["Exchange Code"],
     )
 
-    commody_list = commody_list.drop(columns=["Exchange Code"])
-
-    commody_list = commody_list.set_index("Symbol").sort_index()
-
     return commody_list
 
 
-def get_commodity_quotes(api_key: str) -> pd.DataFrame:
+def get_commodity_quotes(
+    api_key: str, as_index: bool = True, sort: bool = True
+) -> pd.DataFrame:
     """
     Get the quotes for all commodities.
 
     Args:
         api_key (str): the API key from Financial Modeling Prep.
+        as_index (bool): Whether to set the symbol as index. Defaults to True.
+        sort (bool): Whether to sort by the symbol. Defaults to True.
 
     Returns:
         pd.DataFrame: DataFrame of commodity quotes.
     """
-    url = f"https://financialmodelingprep.com/api/v3/quotes/commodity?apikey={api_key}"
-
-    commodity_quotes = get_financial_data(url=url)
-
-    commodity_quotes = commodity_quotes.rename(
-        columns={
-            "symbol": "Symbol",
-            "name": "Name",
-            "price": "Price",
-            "changesPercentage": "Change %",
-            "change": "Change",
-            "dayLow": "Day Low",
-            "dayHigh": "Day High",
-            "yearHigh": "Year High",
-            "yearLow": "Year Low",
-            "marketCap": "Market Cap",
-            "priceAvg50": "50 Day Avg",
-            "priceAvg200": "200 Day Avg",
-            "exchange": "Exchange",
-            "volume": "Volume",
-            "avgVolume": "Avg Volume",
-            "open": "Open",
-            "previousClose": "Previous Close",
-            "eps": "EPS",
-            "pe": "PE",
-            "earningsAnnouncement": "Earnings Announcement",
-            "sharesOutstanding": "Shares Outstanding",
-            "timestamp": "Timestamp",
-        }
+    commodity_quotes = get_quotes(
+        api_key=api_key, asset_class="commodity", as_index=as_index, sort=sort
     )
 
-    commodity_quotes = commodity_quotes.drop(columns=["Exchange"])
-
-    commodity_quotes = commodity_quotes.set_index("Symbol").sort_index()
-
-    commodity_quotes = commodity_quotes.dropna(how="all", axis=1)
-
     return commodity_quotes
 
 
-def get_etf_list(api_key: str) -> pd.DataFrame:
+@cached(endpoint="etf_list", ttl=LIST_TTL)
+def get_etf_list(
+    api_key: str, as_index: bool = True, sort: bool = True
+) -> pd.DataFrame:
     """
     Get a list of ETFs.
 
     Args:
         api_key (str): the API key from Financial Modeling Prep.
+        as_index (bool): Whether to set the symbol as index. Defaults to True.
+        sort (bool): Whether to sort by the symbol. Defaults to True.
 
     Returns:
         pd.DataFrame: DataFrame of ETFs.
     """
     url = f"https://financialmodelingprep.com/api/v3/etf/list?apikey={api_key}"
 
-    etf_list = get_financial_data(url=url)
-
-    etf_list = etf_list.rename(
-        columns={
-            "symbol": "Symbol",
-            "name": "Name",
-            "price": "Price",
-            "exchange": "Exchange",
-            "exchangeShortName": "Exchange Code",
-            "type": "Type",
-        }
+    etf_list = get_discovery_data(
+        url=url,
+        as_index=as_index,
+        sort_index=sort,
+        column_mapping=PRICE_LIST_COLUMNS,
+        drop_columns=["Type"],
     )
 
-    etf_list = etf_list.drop(columns=["Type"])
-
-    etf_list = etf_list.set_index("Symbol").sort_index()
-
     return etf_list
 
 
-def get_index_list(api_key: str) -> pd.DataFrame:
+@cached(endpoint="index_list", ttl=LIST_TTL)
+def get_index_list(
+    api_key: str, as_index: bool = True, sort: bool = True
+) -> pd.DataFrame:
     """
     Get a list of indexes.
 
     Args:
         api_key (str): the API key from Financial Modeling Prep.
+        as_index (bool): Whether to set the symbol as index. Defaults to True.
+        sort (bool): Whether to sort by the symbol. Defaults to True.
 
     Returns:
         pd.DataFrame: DataFrame of indexes.
     """
     url = f"https://financialmodelingprep.com/api/v3/symbol/available-indexes?apikey={api_key}"
 
-    index_list = get_financial_data(url=url)
-
-    index_list = index_list.rename(
-        columns={
-            "symbol": "Symbol",
-            "name": "Name",
-            "currency": "Currency",
-            "stockExchange": "Exchange",
-            "exchangeShortName": "Exchange Code",
-        }
+    index_list = get_discovery_data(
+        url=url,
+        as_index=as_index,
+        sort_index=sort,
+        column_mapping=SYMBOL_LIST_COLUMNS,
+        drop_columns=["Exchange Code"],
     )
 
-    index_list = index_list.drop(columns=["Exchange Code"])
-
-    index_list = index_list.set_index("Symbol").sort_index()
-
     return index_list
 
 
-def get_index_quotes(api_key: str) -> pd.DataFrame:
+def get_index_quotes(
+    api_key: str, as_index: bool = True, sort: bool = True
+) -> pd.DataFrame:
     """
     Get the quotes for all indexes.
 
     Args:
         api_key (str): the API key from Financial Modeling Prep.
+        as_index (bool): Whether to set the symbol as index. Defaults to True.
+        sort (bool): Whether to sort by the symbol. Defaults to True.
 
     Returns:
         pd.DataFrame: DataFrame of index quotes.
     """
-    url = f"https://financialmodelingprep.com/api/v3/quotes/index?apikey={api_key}"
+    index_quotes = get_quotes(
+        api_key=api_key, asset_class="index", as_index=as_index, sort=sort
+    )
 
-    index_quotes = get_financial_data(url=url)
+    return index_quotes
 
-    index_quotes = index_quotes.rename(
-        columns={
-            "symbol": "Symbol",
-            "name": "Name",
-            "price": "Price",
-            "changesPercentage": "Change %",
-            "change": "Change",
-            "dayLow": "Day Low",
-            "dayHigh": "Day High",
-            "yearHigh": "Year High",
-            "yearLow": "Year Low",
-            "marketCap": "Market Cap",
-            "priceAvg50": "50 Day Avg",
-            "priceAvg200": "200 Day Avg",
-            "exchange": "Exchange",
-            "volume": "Volume",
-            "avgVolume": "Avg Volume",
-            "open": "Open",
-            "previousClose": "Previous Close",
-            "eps": "EPS",
-            "pe": "PE",
-            "earningsAnnouncement": "Earnings Announcement",
-            "sharesOutstanding": "Shares Outstanding",
-            "timestamp": "Timestamp",
-        }
-    )
 
-    index_quotes = index_quotes.drop(columns=["Exchange"])
+ENDPOINTS = {
+    "stock_list": get_stock_list,
+    "stock_quotes": get_stock_quotes,
+    "stock_shares_float": get_stock_shares_float,
+    "sectors_performance": get_sectors_performance,
+    "biggest_gainers": get_biggest_gainers,
+    "biggest_losers": get_biggest_losers,
+    "most_active_stocks": get_most_active_stocks,
+    "crypto_list": get_crypto_list,
+    "delisted_stocks": get_delisted_stocks,
+    "crypto_quotes": get_crypto_quotes,
+    "forex_list": get_forex_list,
+    "forex_quotes": get_forex_quotes,
+    "commodity_list": get_commodity_list,
+    "commodity_quotes": get_commodity_quotes,
+    "etf_list": get_etf_list,
+    "index_list": get_index_list,
+    "index_quotes": get_index_quotes,
+}
+
+
+def get_bulk(
+    api_key: str,
+    endpoints: list[str],
+    n_workers: int | None = None,
+    as_index: bool = True,
+    sort: bool = True,
+) -> dict[str, pd.DataFrame]:
+    """
+    Get the data of multiple endpoints at once.
+
+    By using a pool of threads, the API calls of the different endpoints are made at the
+    same time and each thread also processes the data of its endpoint. Given that each
+    call mostly consists of waiting on the API, this means that the total duration equals
+    that of the slowest endpoint instead of the sum of all endpoints.
 
-    index_quotes = index_quotes.set_index("Symbol").sort_index()
+    Args:
+        api_key (str): the API key from Financial Modeling Prep.
+        endpoints (list[str]): The endpoints to collect, e.g. ["stock_quotes", "biggest_gainers"].
+            See ENDPOINTS for the available endpoints.
+        n_workers (int | None): The maximum amount of endpoints that are collected at the
+            same time. Defaults to None which collects all endpoints at once.
+        as_index (bool): Whether to set the symbol, or date, as index. Defaults to True.
+        sort (bool): Whether to sort by the symbol, or date. Defaults to True.
 
-    index_quotes = index_quotes.dropna(how="all", axis=1)
+    Returns:
+        dict[str, pd.DataFrame]: A dictionary with the DataFrame of each endpoint.
+    """
+    invalid_endpoints = [
+        endpoint for endpoint in endpoints if endpoint not in ENDPOINTS
+    ]
+
+    if invalid_endpoints:
+        raise ValueError(
+            f"The following endpoints are not available: {', '.join(invalid_endpoints)}. "
+            f"Choose from: {', '.join(ENDPOINTS)}"
+        )
+
+    if n_workers is not None and n_workers < 1:
+        raise ValueError("The amount of workers should be at least 1.")
+
+    unique_endpoints = list(dict.fromkeys(endpoints))
+
+    if not unique_endpoints:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=n_workers or len(unique_endpoints)) as executor:
+        futures = {
+            endpoint: executor.submit(
+                ENDPOINTS[endpoint], api_key=api_key, as_index=as_index, sort=sort
+            )
+            for endpoint in unique_endpoints
+        }
 
-    return index_quotes
+    # Raises the error of an endpoint, if any, in the main thread
+    return {endpoint: futures[endpoint].result() for endpoint in endpoints}
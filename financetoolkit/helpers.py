@@ -2,14 +2,30 @@
 __docformat__ = "google"
 
 import inspect
+import json
 import time
 import warnings
-from io import StringIO
+from io import BufferedReader, StringIO
 
 import numpy as np
 import pandas as pd
 import requests
-from urllib3.exceptions import MaxRetryError
+from urllib3.exceptions import HTTPError, MaxRetryError
+
+try:
+    import ijson
+
+    ENABLE_IJSON = True
+except ImportError:
+    ENABLE_IJSON = False
+
+# The errors that can occur while the records of a stream are being parsed, which
+# happens after the data has been returned by get_financial_data
+STREAM_ERRORS: tuple[type[Exception], ...] = (
+    HTTPError,
+    OSError,
+    requests.exceptions.RequestException,
+) + ((ijson.JSONError,) if ENABLE_IJSON else ())
 
 RETRY_LIMIT = 12
 
@@ -20,6 +36,8 @@ def get_financial_data(
     url: str,
     sleep_timer: bool = True,
     raw: bool = False,
+    stream: bool = False,
+    session: requests.Session | None = None,
 ) -> pd.DataFrame:
     """
     Collects the financial data from the FinancialModelingPrep API. This is a
@@ -31,6 +49,11 @@ def get_financial_data(
         sleep_timer (bool): Whether to set a sleep timer when the rate limit is reached. Note that this only works
         if you have a Premium subscription (Starter or higher) from FinancialModelingPrep. Defaults to False.
         raw (bool): Whether to return the raw JSON data. Defaults to False.
+        stream (bool): Whether to parse the raw JSON data while it is being downloaded,
+        returning an iterator over the records instead of a list. This requires ijson to
+        be installed and falls back to the regular raw JSON data otherwise. Defaults to False.
+        session (requests.Session | None): The session to use for the request so that connections
+        are reused between requests. Defaults to None which means a new connection is made.
 
     Returns:
         pd.DataFrame: A DataFrame containing the financial data.
@@ -39,12 +62,34 @@ def get_financial_data(
     limit_retry_counter = 0
 
     while True:
+        error_message = None
+
         try:
-            response = requests.get(url, timeout=60)
+            response = (session or requests).get(url, timeout=60, stream=stream)
             response.raise_for_status()
 
+            if raw and stream and ENABLE_IJSON:
+                # Decode possible compression of the response before parsing
+                response.raw.decode_content = True
+                stream_reader = BufferedReader(response.raw)
+
+                if stream_reader.peek().lstrip().startswith(b"["):
+                    return ijson.items(stream_reader, "item", use_float=True)
+
+                # Anything other than a list of records, such as an error, is small
+                # and is therefore read at once so that it can be checked below
+                raw_data = json.loads(stream_reader.read())
+            elif raw:
+                raw_data = response.json()
+
             if raw:
-                return response.json()
+                if isinstance(raw_data, dict) and "Error Message" in raw_data:
+                    # Errors can also be returned with a 200 status code
+                    error_message = raw_data["Error Message"]
+
+                    raise ValueError(error_message)
+
+                return raw_data
 
             json_io = StringIO(response.text)
 
@@ -53,27 +98,29 @@ def get_financial_data(
             return financial_data
 
         except (requests.exceptions.HTTPError, ValueError):
-            if (
-                "not available under your current subscription"
-                in response.json()["Error Message"]
-            ):
+            # The error message is already known when a streamed response was read
+            error_message = error_message or response.json()["Error Message"]
+
+            if "not available under your current subscription" in error_message:
                 return pd.DataFrame(columns=["NOT AVAILABLE"])
 
-            if "Limit Reach" in response.json()["Error Message"]:
+            if "Limit Reach" in error_message:
                 if sleep_timer and limit_retry_counter < RETRY_LIMIT:
                     time.sleep(5.01)
                     limit_retry_counter += 1
                 else:
                     return pd.DataFrame(columns=["LIMIT REACH"])
-            if (
-                "Free plan is limited to US stocks only"
-                in response.json()["Error Message"]
-            ):
+            if "Free plan is limited to US stocks only" in error_message:
                 return pd.DataFrame(columns=["US STOCKS ONLY"])
 
-            if "Invalid API KEY." in response.json()["Error Message"]:
+            if "Invalid API KEY." in error_message:
                 return pd.DataFrame(columns=["INVALID API KEY"])
 
+            if raw and "Limit Reach" not in error_message:
+                # Any other error is not resolved by requesting the data again and is
+                # returned as is so that the caller can report the message
+                return {"Error Message": error_message}
+
         except (
             MaxRetryError,
             requests.exceptions.SSLError,
@@ -2,10 +2,13 @@
 
 __docformat__ = "google"
 
+import numba
 import numpy as np
 import pandas as pd
 import scipy
 
+AUTOCOVARIANCE_DIRECT_FACTOR = 4
+
 
 def get_beta(returns: pd.Series, benchmark_returns: pd.Series) -> pd.Series:
     """
@@ -22,18 +25,133 @@ def get_beta(returns: pd.Series, benchmark_returns: pd.Series) -> pd.Series:
     Returns:
         pd.Series: A Series of beta values with assets as index.
     """
-    excess_returns = returns - returns.mean()
-    excess_benchmark_returns = benchmark_returns - benchmark_returns.mean()
+    if isinstance(returns, pd.Series) and isinstance(benchmark_returns, pd.Series):
+        returns, benchmark_returns = returns.align(benchmark_returns, join="inner")
+
+    returns = np.asarray(returns, dtype=np.float64)
+    benchmark_returns = np.asarray(benchmark_returns, dtype=np.float64)
+
+    # Only consider the periods for which both returns are available, this includes
+    # the variance of the benchmark returns which was previously based on all periods
+    available = ~(np.isnan(returns) | np.isnan(benchmark_returns))
 
-    cov = excess_returns.cov(excess_benchmark_returns)
+    if not available.all():
+        returns = returns[available]
+        benchmark_returns = benchmark_returns[available]
 
-    var = excess_benchmark_returns.var()
+    # Based on cov(x, y) = E[xy] - E[x]E[y] and var(y) = E[y^2] - E[y]^2 which avoids
+    # having to demean the returns. The degrees of freedom cancel out in the ratio.
+    n = len(returns)
+    sum_returns = returns.sum()
+    sum_benchmark_returns = benchmark_returns.sum()
+
+    cov = n * (returns @ benchmark_returns) - sum_returns * sum_benchmark_returns
+    var = n * (benchmark_returns @ benchmark_returns) - sum_benchmark_returns**2
 
     beta_values = cov / var
 
     return beta_values
 
 
+@numba.njit(
+    numba.float64[:](numba.float64[:], numba.float64[:], numba.int64),
+    cache=True,
+    error_model="numpy",
+)
+def get_rolling_beta_values(
+    returns: np.ndarray, benchmark_returns: np.ndarray, window: int
+) -> np.ndarray:
+    """
+    Calculate the beta for each window of a given size with running sums.
+
+    Rather than recalculating the covariance and variance for every window, the sums of
+    the returns, the benchmark returns, their cross product and the squared benchmark
+    returns are updated by adding the observation that enters and subtracting the one that
+    leaves the window. This makes each window O(1) instead of O(window).
+
+    Args:
+        returns (np.ndarray): An array of returns.
+        benchmark_returns (np.ndarray): An array of benchmark returns.
+        window (int): The number of periods in each window.
+
+    Returns:
+        np.ndarray: The beta values which are NaN until a full window without
+        missing values is available.
+    """
+    n = len(returns)
+    beta_values = np.full(n, np.nan)
+
+    sum_returns = 0.0
+    sum_benchmark_returns = 0.0
+    sum_cross_product = 0.0
+    sum_squared_benchmark_returns = 0.0
+    observations = 0
+
+    for t in range(n):
+        if not (np.isnan(returns[t]) or np.isnan(benchmark_returns[t])):
+            sum_returns += returns[t]
+            sum_benchmark_returns += benchmark_returns[t]
+            sum_cross_product += returns[t] * benchmark_returns[t]
+            sum_squared_benchmark_returns += benchmark_returns[t] ** 2
+            observations += 1
+
+        if t >= window:
+            old = t - window
+
+            if not (np.isnan(returns[old]) or np.isnan(benchmark_returns[old])):
+                sum_returns -= returns[old]
+                sum_benchmark_returns -= benchmark_returns[old]
+                sum_cross_product -= returns[old] * benchmark_returns[old]
+                sum_squared_benchmark_returns -= benchmark_returns[old] ** 2
+                observations -= 1
+
+        if observations == window:
+            cov = window * sum_cross_product - sum_returns * sum_benchmark_returns
+            var = window * sum_squared_benchmark_returns - sum_benchmark_returns**2
+
+            beta_values[t] = cov / var
+
+    return beta_values
+
+
+def get_rolling_beta(
+    returns: pd.Series, benchmark_returns: pd.Series, window: int
+) -> pd.Series:
+    """
+    Calculate the beta of returns with respect to a benchmark over a rolling window.
+
+    Beta measures the sensitivity of an asset's returns to changes in the returns of a benchmark.
+    By calculating it over a rolling window, it shows how this sensitivity evolves over time.
+    The windows are updated incrementally, so the calculation scales with the length of the
+    series and not with the size of the window.
+
+    Args:
+        returns (pd.Series): A Series of returns.
+        benchmark_returns (pd.Series): A Series of benchmark returns.
+        window (int): The number of periods in each window.
+
+    Returns:
+        pd.Series: A Series of beta values for the periods in which both returns are
+        available. The first window - 1 values and any window with missing values are NaN.
+    """
+    if window < 1:
+        raise ValueError("The window must be at least 1.")
+
+    if isinstance(returns, pd.Series) and isinstance(benchmark_returns, pd.Series):
+        returns, benchmark_returns = returns.align(benchmark_returns, join="inner")
+
+    if len(returns) != len(benchmark_returns):
+        raise ValueError("The returns and benchmark returns must be of equal length.")
+
+    beta_values = get_rolling_beta_values(
+        np.ascontiguousarray(returns, dtype=np.float64),
+        np.ascontiguousarray(benchmark_returns, dtype=np.float64),
+        int(window),
+    )
+
+    return pd.Series(beta_values, index=getattr(returns, "index", None))
+
+
 def get_pearsons_correlation(series1: pd.Series, series2: pd.Series) -> float:
     """
     Calculate Pearson's Correlation Coefficient between two given series.
@@ -50,8 +168,15 @@ def get_pearsons_correlation(series1: pd.Series, series2: pd.Series) -> float:
     Returns:
         float: Pearson's Correlation Coefficient.
     """
-    correlation_matrix = np.corrcoef(series1, series2)
-    correlation_coefficient = correlation_matrix[0, 1]
+    demeaned_series1 = np.asarray(series1, dtype=np.float64)
+    demeaned_series2 = np.asarray(series2, dtype=np.float64)
+
+    demeaned_series1 = demeaned_series1 - demeaned_series1.mean()
+    demeaned_series2 = demeaned_series2 - demeaned_series2.mean()
+
+    correlation_coefficient = (demeaned_series1 @ demeaned_series2) / np.sqrt(
+        (demeaned_series1 @ demeaned_series1) * (demeaned_series2 @ demeaned_series2)
+    )
 
     return correlation_coefficient
 
@@ -71,14 +196,27 @@ def get_spearman_correlation(series1: pd.Series, series2: pd.Series) -> float:
     Returns:
         float: Spearman Correlation Coefficient.
     """
-    rank_series1 = series1.rank()
-    rank_series2 = series2.rank()
+    if isinstance(series1, pd.Series) and isinstance(series2, pd.Series):
+        series1, series2 = series1.align(series2, join="inner")
+
+    series1 = np.asarray(series1, dtype=np.float64)
+    series2 = np.asarray(series2, dtype=np.float64)
+
+    # Only rank the observations that are available in both series as the ranks
+    # would otherwise be shifted by the missing values of the other series
+    available = ~(np.isnan(series1) | np.isnan(series2))
+
+    if not available.all():
+        series1 = series1[available]
+        series2 = series2[available]
+
+    rank_series1 = scipy.stats.rankdata(series1, method="average")
+    rank_series2 = scipy.stats.rankdata(series2, method="average")
 
     d = rank_series1 - rank_series2
-    d_squared = d**2
 
-    n = len(series1)
-    spearman_corr = 1 - (6 * d_squared.sum()) / (n * (n**2 - 1))
+    n = len(d)
+    spearman_corr = 1 - (6 * (d @ d)) / (n * (n**2 - 1))
 
     return spearman_corr
 
@@ -117,7 +255,69 @@ def get_standard_deviation(data: pd.Series) -> float:
     return data.std()
 
 
-def get_ar_weights_lsm(series: np.ndarray, p: int) -> tuple:
+@numba.njit(numba.float64[:](numba.float64[:], numba.int64), cache=True)
+def get_autocovariance_direct(series: np.ndarray, nlags: int) -> np.ndarray:
+    """
+    Calculate the autocovariance of a series for lags 0 up to and including nlags
+    by directly summing the lagged products.
+
+    Args:
+        series (np.ndarray): The time series data.
+        nlags (int): The maximum lag to calculate the autocovariance for.
+
+    Returns:
+        np.ndarray: The autocovariance for lags 0, 1, ..., nlags.
+    """
+    n = len(series)
+    autocov = np.empty(nlags + 1)
+
+    for k in range(nlags + 1):
+        total = 0.0
+
+        for i in range(k, n):
+            total += series[i] * series[i - k]
+
+        autocov[k] = total / n
+
+    return autocov
+
+
+def get_autocovariance(series: np.ndarray, nlags: int) -> np.ndarray:
+    """
+    Calculate the autocovariance of a series for lags 0 up to and including nlags.
+
+    For a small number of lags, the lagged products are summed directly. Otherwise, the
+    full correlation of the series with itself is computed once through the Fast Fourier
+    Transform after which the requested lags are sliced out. The direct calculation costs
+    O(n * nlags) and the FFT O(n * log(n)) but with a much larger constant, benchmarks show
+    the direct calculation to be faster as long as nlags is below AUTOCOVARIANCE_DIRECT_FACTOR
+    times log2(n).
+
+    Args:
+        series (np.ndarray): The time series data.
+        nlags (int): The maximum lag to calculate the autocovariance for.
+
+    Returns:
+        np.ndarray: The autocovariance for lags 0, 1, ..., nlags.
+    """
+    series = np.ascontiguousarray(series, dtype=np.float64)
+    n = len(series)
+
+    if nlags < AUTOCOVARIANCE_DIRECT_FACTOR * np.log2(max(n, 2)):
+        return get_autocovariance_direct(series, int(nlags))
+
+    # Zero-pad to avoid the circular correlation wrapping around
+    fft_length = scipy.fft.next_fast_len(2 * n - 1, real=True)
+    transformed = scipy.fft.rfft(series, n=fft_length)
+
+    full_correlation = scipy.fft.irfft(transformed * transformed.conj(), n=fft_length)
+
+    return full_correlation[: nlags + 1] / n
+
+
+def get_ar_weights_lsm(
+    series: np.ndarray, p: int, dtype: type[np.floating] = np.float64
+) -> tuple:
     """
     Fit an AR(p) model to a time series.
 
@@ -134,27 +334,115 @@ def get_ar_weights_lsm(series: np.ndarray, p: int) -> tuple:
     - Sensible to outliers.
 
     Args:
-        series (np.ndarry): The time series data to model.
+        series (np.ndarry): The time series data to model. A 2D array is treated as a collection
+            of time series of equal length (one per column) which are all fitted at once.
         p (int): The order of the autoregressive model, indicating how many past values to consider.
+        dtype (type[np.floating], optional): The data type used to store the lagged values. Using
+            np.float32 halves the memory traffic of building and multiplying the lagged values which
+            is worthwhile for long series of bounded values such as returns. The resulting (p + 1) x (p + 1)
+            system is always solved in float64. Defaults to np.float64.
 
     Returns:
         tuple: A tuple containing three elements:
             - numpy array of estimated parameters phi,
             - float representing the estimated constant c,
             - float representing the sigma squared of the white noise.
+        For a 2D array, each element has an additional leading dimension for the columns.
     """
-    X = np.column_stack(
-        [np.ones(len(series) - p)] + [series[i : len(series) - p + i] for i in range(p)]
-    )
-    Y = series[p:]
+    series = np.asarray(series, dtype=dtype)
+
+    if series.ndim > 1:
+        return get_ar_weights_lsm_batch(series, p, dtype)
+
+    # Each window holds p lagged values (oldest first) followed by the target value
+    windows = np.lib.stride_tricks.sliding_window_view(series, p + 1)
+
+    X = np.empty((len(windows), p + 1), dtype=dtype)
+    X[:, 0] = 1
+    X[:, 1:] = windows[:, :-1]
+    Y = windows[:, -1]
 
     # Solving for AR coefficients and constant term using the Least Squares Method
-    params = np.linalg.lstsq(X, Y, rcond=None)[0]
+    # through the normal equations which, given that p is small compared to the
+    # length of the series, is much cheaper than the SVD used by lstsq
+    XtX = (X.T @ X).astype(np.float64)
+    XtY = (X.T @ Y).astype(np.float64)
+    YtY = np.float64(Y @ Y)
+
+    try:
+        params = scipy.linalg.cho_solve(scipy.linalg.cho_factor(XtX, lower=True), XtY)
+        residual_sum_of_squares = max(YtY - params @ XtY, 0)
+    except np.linalg.LinAlgError:
+        # The design matrix is rank deficient, fall back to the SVD based solver
+        params, residual_sum_of_squares, *_ = np.linalg.lstsq(X, Y, rcond=None)
+        params = params.astype(np.float64)
+
+        # The sum of squared residuals is only returned when X has full rank
+        if residual_sum_of_squares.size:
+            residual_sum_of_squares = np.float64(residual_sum_of_squares[0])
+        else:
+            residuals = Y - X @ params
+            residual_sum_of_squares = residuals @ residuals
+
     phi = params[1:]
     c = params[0]
 
-    residuals = Y - X @ params
-    sigma2 = residuals @ residuals / len(Y)
+    sigma2 = residual_sum_of_squares / len(Y)
+
+    return phi, c, sigma2
+
+
+def get_ar_weights_lsm_batch(
+    series: np.ndarray, p: int, dtype: type[np.floating] = np.float64
+) -> tuple:
+    """
+    Fit an AR(p) model to each column of a 2D array with the Least Squares Method.
+
+    The lagged values of all columns are built from a single sliding window view and
+    the normal equations of all columns are formed and solved as one stack of
+    (p + 1) x (p + 1) systems. If any of these systems is singular, each column is
+    fitted separately so that the SVD based fallback of get_ar_weights_lsm is used.
+
+    Args:
+        series (np.ndarry): The time series data to model with one series per column.
+        p (int): The order of the autoregressive model, indicating how many past values to consider.
+        dtype (type[np.floating], optional): The data type used to store the lagged values.
+            Defaults to np.float64.
+
+    Returns:
+        tuple: A tuple containing three elements:
+            - numpy array of estimated parameters phi with one row per column,
+            - numpy array of the estimated constants c per column,
+            - numpy array of the sigma squared of the white noise per column.
+    """
+    series = np.asarray(series, dtype=dtype)
+
+    # The windows have the shape (columns, observations - p, p + 1)
+    windows = np.lib.stride_tricks.sliding_window_view(series.T, p + 1, axis=1)
+
+    X = np.empty(windows.shape, dtype=dtype)
+    X[..., 0] = 1
+    X[..., 1:] = windows[..., :-1]
+    Y = windows[..., -1]
+
+    Xt = X.transpose(0, 2, 1)
+    XtX = (Xt @ X).astype(np.float64)
+    XtY = (Xt @ Y[..., np.newaxis])[..., 0].astype(np.float64)
+    YtY = np.einsum("ij,ij->i", Y, Y).astype(np.float64)
+
+    try:
+        params = np.linalg.solve(XtX, XtY[..., np.newaxis])[..., 0]
+    except np.linalg.LinAlgError:
+        weights = [get_ar_weights_lsm(column, p, dtype) for column in series.T]
+
+        return tuple(np.array(values) for values in zip(*weights))
+
+    residual_sum_of_squares = np.maximum(YtY - np.einsum("ij,ij->i", params, XtY), 0)
+
+    phi = params[:, 1:]
+    c = params[:, 0]
+
+    sigma2 = residual_sum_of_squares / Y.shape[1]
 
     return phi, c, sigma2
 
@@ -178,17 +466,13 @@ def estimate_ar_weights_yule_walker(series: pd.Series, p: int) -> tuple:
             - float representing the estimated constant c,
             - float representing the sigma squared of the white noise.
     """
-    autocov = [
-        np.correlate(series, series, mode="full")[len(series) - 1 - i] / len(series)
-        for i in range(p + 1)
-    ]
+    autocov = get_autocovariance(series, p)
 
-    # Create the Yule-Walker matrices
-    R = scipy.linalg.toeplitz(autocov[:p])
     r = autocov[1 : p + 1]
 
-    # Solve the Yule-Walker equations
-    phi = np.linalg.solve(R, r)
+    # Solve the Yule-Walker equations with the Levinson-Durbin recursion which makes
+    # use of the symmetric Toeplitz structure instead of constructing the matrix
+    phi = scipy.linalg.solve_toeplitz(autocov[:p], r)
     mu = series.mean()
     c = mu * (1 - np.sum(phi))
     sigma2 = autocov[0] - phi @ r
@@ -196,6 +480,44 @@ def estimate_ar_weights_yule_walker(series: pd.Series, p: int) -> tuple:
     return phi, c, sigma2
 
 
+@numba.njit(
+    numba.float64[:](numba.float64[:], numba.float64[:], numba.float64, numba.int64),
+    cache=True,
+)
+def get_ar_forecast(
+    recent_values: np.ndarray, phi: np.ndarray, c: float, steps: int
+) -> np.ndarray:
+    """
+    Forecast the next values of a time series with the recurrence of an AR(p) model.
+
+    The recent values and the forecasts are kept in a single buffer so that each step
+    only requires p multiply-adds over the preceding p values.
+
+    Args:
+        recent_values (np.ndarray): The last p observations, oldest first.
+        phi (np.ndarray): Estimated parameters of the AR model, ordered like recent_values.
+        c (float): The constant term of the AR model.
+        steps (int): The number of future time steps to predict.
+
+    Returns:
+        np.ndarray: Predicted values for the specified number of future steps.
+    """
+    p = len(phi)
+
+    values = np.empty(p + steps)
+    values[:p] = recent_values
+
+    for i in range(steps):
+        next_value = c
+
+        for j in range(p):
+            next_value += phi[j] * values[i + j]
+
+        values[p + i] = next_value
+
+    return values[p:]
+
+
 def get_ar(
     data: np.ndarray | pd.Series | pd.DataFrame,
     p: int = 1,
@@ -227,7 +549,8 @@ def get_ar(
             to consider. It is only used if c or phi isn't provided. Defaults to 1.
         steps (int, optional): The number of future time steps to predict. Defaults to 1.
         phi (np.ndarray | None): Estimated parameters of the AR model.
-        c (float | None): The constant term of the AR model.
+        c (float | None): The constant term of the AR model. If only phi is provided, it is
+            derived from the mean of the data as mean * (1 - sum(phi)).
         method (str, optional): The method to use to estimate the AR parameters. Can be
             'lsm' (Least Squares Method) or 'yw' (Yule-Walker Method). Defaults to 'lsm'.
             See the weight calculation functions documentation for more details.
@@ -239,8 +562,22 @@ def get_ar(
     if isinstance(data, pd.DataFrame):
         if data.index.nlevels != 1:
             raise ValueError("Expects single index DataFrame, no other value.")
+
+        if phi is None and method == "lsm" and not data.isna().to_numpy().any():
+            # All columns are of equal length and can therefore be fitted at once
+            phis, constants, _ = get_ar_weights_lsm(data.to_numpy(), p)
+
+            return pd.DataFrame(
+                {
+                    column: get_ar(
+                        data[column], steps=steps, phi=phis[i], c=constants[i]
+                    )
+                    for i, column in enumerate(data.columns)
+                }
+            )
+
         return data.aggregate(
-            lambda x: get_ar(x, steps=steps, phi=phi, p=p, method=method)
+            lambda x: get_ar(x, p=p, steps=steps, phi=phi, c=c, method=method)
         )
     if isinstance(data, pd.Series):
         data = data.to_numpy()
@@ -252,18 +589,57 @@ def get_ar(
             phi, c, _ = estimate_ar_weights_yule_walker(data, p)
         else:
             raise ValueError("Method must be 'lsm' or 'yw'.")
+    elif c is None:
+        # Choose the constant so that the mean of the process equals the mean of the data
+        c = np.mean(data) * (1 - np.sum(phi))
+
+    return get_ar_forecast(
+        np.ascontiguousarray(data[-len(phi) :], dtype=np.float64),
+        np.ascontiguousarray(phi, dtype=np.float64),
+        float(c),
+        int(steps),
+    )
 
-    predictions = np.zeros(steps)
-    recent_values = list(data[-p:])
 
-    for i in range(steps):
-        next_value = c + phi @ recent_values
-        predictions[i] = next_value
+@numba.njit(
+    numba.types.Tuple((numba.float64[:], numba.float64))(
+        numba.float64[:], numba.float64[:]
+    ),
+    cache=True,
+)
+def get_ma_errors(theta: np.ndarray, data: np.ndarray) -> tuple:
+    """
+    Calculate the residuals/errors of an MA(q) model through its recurrence.
 
-        recent_values.append(next_value)
-        recent_values.pop(0)
+    Each error is the observed value minus the weighted sum of the q preceding
+    errors. As this recurrence can't be vectorized, it is compiled with Numba and
+    also accumulates the sum of squared errors along the way.
 
-    return predictions
+    Args:
+        theta (np.ndarray): The MA parameters (theta_1, ..., theta_q).
+        data (np.ndarray): Observed time series data.
+
+    Returns:
+        tuple:
+            - np.ndarray: Residuals/errors from the MA model.
+            - float: The sum of squared errors from index q onwards.
+    """
+    q = len(theta)
+    n = len(data)
+
+    errors = np.zeros(n)
+    sum_of_squared_errors = 0.0
+
+    for t in range(q, n):
+        error = data[t]
+
+        for j in range(q):
+            error -= theta[j] * errors[t - 1 - j]
+
+        errors[t] = error
+        sum_of_squared_errors += error * error
+
+    return errors, sum_of_squared_errors
 
 
 def ma_likelihood(params, data: np.ndarray) -> float:
@@ -280,28 +656,79 @@ def ma_likelihood(params, data: np.ndarray) -> float:
             - float: The negative log-likelihood of the MA model.
             - np.ndarray: Residuals/errors from the MA model.
     """
-    q = len(params) - 1
-    theta = params[:-1]
+    theta = np.ascontiguousarray(params[:-1], dtype=np.float64)
     sigma2 = params[-1]
     n = len(data)
 
-    errors = np.zeros(n)
-
-    for t in range(q, n):
-        errors[t] = data[t] - theta @ errors[t - q : t][::-1]
-    likelihood = -n / 2 * np.log(2 * np.pi * sigma2) - np.sum(errors[q:] ** 2) / (
+    errors, sum_of_squared_errors = get_ma_errors(
+        theta, np.asarray(data, dtype=np.float64)
+    )
+    likelihood = -n / 2 * np.log(2 * np.pi * sigma2) - sum_of_squared_errors / (
         2 * sigma2
     )
 
     return -likelihood, errors
 
 
-def fit_ma_model(data: np.ndarray, q: int) -> tuple:
+@numba.njit(
+    numba.types.Tuple((numba.float64[:, :], numba.float64[:]))(
+        numba.float64[:], numba.int64
+    ),
+    cache=True,
+)
+def get_innovations(autocov: np.ndarray, m: int) -> tuple:
+    """
+    Run the Innovations Algorithm on a set of autocovariances.
+
+    The algorithm recursively determines the coefficients theta_{n,j} of the best linear
+    predictor of the next observation based on the previous innovations, together with
+    the mean squared error v_n of that predictor. It is described in Brockwell and Davis
+    (2002), Introduction to Time Series and Forecasting, Section 2.5.2 and 5.1.3.
+
+    Args:
+        autocov (np.ndarray): The autocovariances for lags 0 up to and including m.
+        m (int): The number of recursions to run.
+
+    Returns:
+        tuple:
+            - np.ndarray: The (m + 1) x (m + 1) matrix of coefficients theta_{n,j}.
+            - np.ndarray: The mean squared errors v_0, ..., v_m.
+    """
+    theta = np.zeros((m + 1, m + 1))
+    v = np.zeros(m + 1)
+    v[0] = autocov[0]
+
+    for n in range(1, m + 1):
+        for k in range(n):
+            value = autocov[n - k]
+
+            for j in range(k):
+                value -= theta[k, k - j] * theta[n, n - j] * v[j]
+
+            theta[n, n - k] = value / v[k]
+
+        v[n] = autocov[0]
+
+        for j in range(n):
+            v[n] -= theta[n, n - j] ** 2 * v[j]
+
+    return theta, v
+
+
+def fit_ma_model(data: np.ndarray, q: int, method: str = "innovations") -> tuple:
     """
     Fit an MA(q) model to the time series data.
 
-    Finds the parameters of the MA model that minimize the negative log-likelihood of
-    the observed data and calculate residuals.
+    By default, the parameters are estimated with the Innovations Algorithm. This is
+    a direct method that derives the parameters from the autocovariances of the
+    (demeaned) data in a single recursion and is therefore fast and deterministic.
+    The number of recursions is set to the square root of the number of observations
+    (with a minimum of q) as the estimates only become consistent when running more
+    recursions than the order of the model. See Brockwell and Davis (2002), Introduction
+    to Time Series and Forecasting, Section 5.1.3.
+
+    Alternatively, the MLE method finds the parameters of the MA model that minimize
+    the negative log-likelihood of the observed data and calculate residuals.
 
     This MLE method is described in:
     @inbook{NBERc12707,
@@ -327,6 +754,9 @@ def fit_ma_model(data: np.ndarray, q: int) -> tuple:
     Args:
         data (np.ndarray): Observed time series data.
         q (int): The order of the MA model.
+        method (str, optional): The method to use to estimate the MA parameters. Can be
+            'innovations' (Innovations Algorithm) or 'mle' (Maximum Likelihood Estimation).
+            Defaults to 'innovations'.
 
     Returns:
         tuple:
@@ -334,6 +764,43 @@ def fit_ma_model(data: np.ndarray, q: int) -> tuple:
             - float: The variance sigma of the fitted MA model.
             - np.ndarray: The residuals/errors from the fitted MA model.
     """
+    data = np.asarray(data, dtype=np.float64)
+
+    if np.isnan(data).any():
+        raise ValueError(
+            "The data contains missing values which can't be used to fit an MA model."
+        )
+
+    if len(data) <= q:
+        raise ValueError(
+            "Data length must be larger than the MA order (q) to fit an MA model."
+        )
+
+    if method == "innovations":
+        demeaned_data = data - data.mean()
+
+        m = min(len(data) - 1, max(q, int(np.sqrt(len(data)))))
+
+        autocov = get_autocovariance(demeaned_data, m)
+
+        if not autocov[0] > 0:
+            raise ValueError(
+                "The data must have a positive variance to fit an MA model, which is "
+                "not the case for a constant series."
+            )
+
+        innovations, v = get_innovations(autocov, int(m))
+
+        theta = innovations[m, 1 : q + 1]
+        sigma2 = v[m]
+
+        errors, _ = get_ma_errors(theta, demeaned_data)
+
+        return theta, sigma2, errors[q:]
+
+    if method != "mle":
+        raise ValueError("Method must be 'innovations' or 'mle'.")
+
     initial_params = np.zeros(q + 1)
     initial_params[-1] = np.var(data)
 
@@ -352,6 +819,42 @@ def fit_ma_model(data: np.ndarray, q: int) -> tuple:
     return result.x[:-1], result.x[-1], errors[q:]
 
 
+def get_ma_forecast(
+    errors: np.ndarray, theta: np.ndarray, mu: float, steps: int
+) -> np.ndarray:
+    """
+    Forecast the next values of a time series with an MA(q) model.
+
+    Future errors are expected to be zero, thus only the first q forecasts depend on
+    the past errors and any forecast beyond that equals the mean.
+
+    Args:
+        errors (np.ndarray): Array of past errors (residuals) from the model.
+        theta (np.ndarray): Estimated parameters of the MA model.
+        mu (float): The mean of the time series.
+        steps (int): The number of future time steps to predict.
+
+    Returns:
+        np.ndarray: Predicted values for the specified number of future steps.
+    """
+    q = len(theta)
+    predictions = np.full(steps, mu)
+
+    if q == 0:
+        return predictions
+
+    # The errors are stored most recent first so that the forecast for step i is
+    # the dot product of theta_(i+1), ..., theta_q with the leading errors, errors
+    # before the start of the series are unknown and therefore equal to zero
+    recent_errors = np.zeros(q)
+    recent_errors[: min(q, len(errors))] = errors[-q:][::-1]
+
+    for i in range(min(steps, q)):
+        predictions[i] += theta[i:] @ recent_errors[: q - i]
+
+    return predictions
+
+
 def get_ma(
     data: np.ndarray | pd.Series | pd.DataFrame,
     q: int,
@@ -382,28 +885,25 @@ def get_ma(
     if isinstance(data, pd.DataFrame):
         if data.index.nlevels != 1:
             raise ValueError("Expects single index DataFrame.")
+
+        # Unlike get_ar, the columns are fitted one by one. Most of the work is the FFT
+        # of the autocovariances which is not faster for all columns at once, while the
+        # recursions of the Innovations Algorithm and the errors are per column anyway.
         return data.aggregate(
             lambda x: get_ma(x, q=q, steps=steps, theta=theta, errors=errors)
         )
     if isinstance(data, pd.Series):
         data = data.to_numpy()
 
-    if theta is None or errors is None:
-        theta, _, errors = fit_ma_model(data, q)
-
     if len(data) < q:
         raise ValueError("Data length must be at least equal to the MA order (q).")
 
-    mu = np.mean(data)
-    predictions = np.full(steps, mu)
-
-    for i in range(steps):
-        if i < q:
-            relevant_errors = (
-                errors[-q:]
-                if i == 0
-                else np.concatenate((errors[-(q - i) :], np.zeros(i)))
-            )
-            predictions[i] += theta[: len(relevant_errors)] @ relevant_errors[::-1]
+    if theta is None or errors is None:
+        theta, _, errors = fit_ma_model(data, q)
 
-    return predictions
+    return get_ma_forecast(
+        np.asarray(errors, dtype=np.float64),
+        np.asarray(theta, dtype=np.float64),
+        np.mean(data),
+        steps,
+    )
@@ -0,0 +1,90 @@
+"""Cache Model Tests"""
+
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from financetoolkit.discovery import cache_model
+
+# pylint: disable=missing-function-docstring,redefined-outer-name
+
+data = pd.DataFrame({"Name": ["Apple", "Microsoft"]}, index=["AAPL", "MSFT"])
+
+
+@pytest.fixture
+def file_cache(tmp_path, monkeypatch):
+    file_cache = cache_model.FileCache(str(tmp_path))
+    monkeypatch.setattr(cache_model, "file_cache", file_cache)
+
+    return file_cache
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def get_names(file_cache, calls):  # pylint: disable=unused-argument
+    @cache_model.cached("names", ttl=60)
+    def get_names(api_key, as_index=True, empty=False):
+        calls.append((api_key, as_index))
+
+        return data.iloc[:0] if empty else data
+
+    return get_names
+
+
+def test_file_cache(recorder, file_cache, monkeypatch):
+    file_cache.save("names", "key", data, ttl=60)
+
+    recorder.capture(file_cache.load("names", "key"))
+    recorder.capture(sorted(os.listdir(file_cache.get_path("names", ""))))
+
+    current_time = time.time()
+    monkeypatch.setattr(time, "time", lambda: current_time + 61)
+
+    recorder.capture(file_cache.load("names", "key") is None)
+
+
+def test_file_cache_corrupted(recorder, file_cache):
+    file_cache.save("names", "key", data, ttl=60)
+
+    with open(file_cache.get_path("names", "key.pickle"), "wb") as pickle_file:
+        pickle_file.write(b"corrupted")
+
+    recorder.capture(file_cache.load("names", "key") is None)
+
+
+def test_file_cache_write_failure(recorder, file_cache, monkeypatch):
+    def replace(source, destination):
+        raise OSError("Read-only file system")
+
+    monkeypatch.setattr(os, "replace", replace)
+
+    file_cache.save("names", "key", data, ttl=60)
+
+    recorder.capture(file_cache.load("names", "key") is None)
+    recorder.capture(sorted(os.listdir(file_cache.get_path("names", ""))))
+
+
+def test_cached(recorder, get_names, calls):
+    recorder.capture(get_names("first_key"))
+
+    # The same arguments, passed differently and with a different API key, should
+    # result in the same cache key and therefore not collect the data again
+    recorder.capture(get_names(api_key="second_key", as_index=True))
+    recorder.capture(calls)
+
+    get_names("first_key", as_index=False)
+
+    recorder.capture(calls)
+
+
+def test_cached_empty(recorder, get_names, calls):
+    get_names("first_key", empty=True)
+    get_names("first_key", empty=True)
+
+    recorder.capture(calls)
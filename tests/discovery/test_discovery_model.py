@@ -0,0 +1,299 @@
+"""Discovery Model Tests"""
+
+import json
+from io import BytesIO
+
+import pandas as pd
+import pytest
+import requests
+
+from financetoolkit.discovery import cache_model, discovery_model
+from financetoolkit.discovery.cache_model import FileCache
+
+# pylint: disable=missing-function-docstring,protected-access
+
+GAINERS_URL = "https://financialmodelingprep.com/api/v3/stock_market/gainers?apikey=x"
+CRYPTO_URL = "https://financialmodelingprep.com/api/v3/quotes/crypto?apikey=x"
+STOCK_LIST_URL = "https://financialmodelingprep.com/api/v3/stock/list?apikey=x"
+
+STOCK_LIST_RECORDS = [
+    {
+        "symbol": "NA",
+        "name": "Nano Labs",
+        "price": 1.25,
+        "exchange": "NASDAQ",
+        "exchangeShortName": "NASDAQ",
+        "type": "stock",
+    },
+    {
+        "symbol": "SPY",
+        "name": "SPDR S&P 500 ETF Trust",
+        "price": 500.5,
+        "exchange": "New York Stock Exchange Arca",
+        "exchangeShortName": "AMEX",
+        "type": "etf",
+    },
+    {
+        "symbol": "2330.TW",
+        "name": "Taiwan Semiconductor",
+        "price": 800.0,
+        "exchange": "Taiwan",
+        "exchangeShortName": "TAI",
+        "type": "stock",
+    },
+]
+STOCK_LIST_CSV = (
+    b"symbol,name,price,exchange,exchangeShortName,type\n"
+    b"NA,Nano Labs,1.25,NASDAQ,NASDAQ,stock\n"
+    b"SPY,SPDR S&P 500 ETF Trust,500.5,New York Stock Exchange Arca,AMEX,etf\n"
+    b"2330.TW,Taiwan Semiconductor,800.0,Taiwan,TAI,stock\n"
+)
+
+
+def create_response(payload, status_code=200):
+    response = requests.Response()
+    response._content = (
+        payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+    )
+    response.status_code = status_code
+    response.raw = BytesIO(response._content)
+
+    return response
+
+
+@pytest.fixture
+def respond(monkeypatch):
+    def set_responses(responses):
+        monkeypatch.setattr(
+            discovery_model.SESSION,
+            "get",
+            lambda url, **kwargs: responses(url) if callable(responses) else responses,
+        )
+
+    return set_responses
+
+
+@pytest.fixture
+def csv_cache(tmp_path, monkeypatch):
+    csv_cache = FileCache(str(tmp_path))
+    monkeypatch.setattr(discovery_model, "file_cache", csv_cache)
+    monkeypatch.setattr(discovery_model, "CSV_UNSUPPORTED_ENDPOINTS", set())
+
+    return csv_cache
+
+
+def get_stock_list(csv=True):
+    return discovery_model.get_discovery_data(
+        url=STOCK_LIST_URL,
+        column_mapping=discovery_model.PRICE_LIST_COLUMNS,
+        drop_columns=["Type"],
+        record_filter={"type": "stock"},
+        csv=csv,
+    )
+
+
+def test_get_discovery_data(recorder, respond):
+    respond(
+        create_response(
+            [
+                {"symbol": "MSFT", "name": "Microsoft", "change": 1.5, "price": 400.0},
+                {"symbol": "AAPL", "name": "Apple", "change": -0.5, "price": 200.0},
+            ]
+        )
+    )
+
+    recorder.capture(
+        discovery_model.get_discovery_data(
+            url=GAINERS_URL, column_mapping=discovery_model.MARKET_MOVERS_COLUMNS
+        )
+    )
+
+
+def test_get_discovery_data_error_message(recorder, respond):
+    respond(create_response({"Error Message": "Invalid API KEY. Please retry."}))
+
+    recorder.capture(
+        discovery_model.get_discovery_data(
+            url=GAINERS_URL, column_mapping=discovery_model.MARKET_MOVERS_COLUMNS
+        )
+    )
+
+
+def test_get_discovery_data_unknown_error_message(respond):
+    respond(create_response({"Error Message": "Unknown error."}))
+
+    with pytest.raises(ValueError, match="Unknown error."):
+        discovery_model.get_discovery_data(
+            url=GAINERS_URL, column_mapping=discovery_model.MARKET_MOVERS_COLUMNS
+        )
+
+
+def test_get_discovery_data_unexpected_payload(respond):
+    respond(create_response({"message": "unexpected"}))
+
+    with pytest.raises(ValueError, match="Expected a list of records"):
+        discovery_model.get_discovery_data(
+            url=CRYPTO_URL, column_mapping=discovery_model.QUOTE_COLUMNS
+        )
+
+
+def test_get_discovery_data_stream(recorder, respond):
+    respond(
+        create_response(
+            b'[{"symbol": "MSFT", "name": "Microsoft", "price": 400.0}, '
+            b'{"symbol": "AAPL", "name": "Apple", "price": 200.0}]'
+        )
+    )
+
+    recorder.capture(
+        discovery_model.get_discovery_data(
+            url=GAINERS_URL,
+            column_mapping=discovery_model.MARKET_MOVERS_COLUMNS,
+            stream=True,
+        )
+    )
+
+
+def test_get_discovery_data_stream_error_message(recorder, respond):
+    respond(create_response({"Error Message": "Invalid API KEY. Please retry."}))
+
+    recorder.capture(
+        discovery_model.get_discovery_data(
+            url=GAINERS_URL,
+            column_mapping=discovery_model.MARKET_MOVERS_COLUMNS,
+            stream=True,
+        )
+    )
+
+
+def test_get_discovery_data_stream_interrupted(recorder, respond):
+    responses = iter(
+        [
+            create_response(b'[{"symbol": "MSFT", "name": "Microsoft"}, {"symbol'),
+            create_response(
+                [
+                    {"symbol": "MSFT", "name": "Microsoft"},
+                    {"symbol": "AAPL", "name": "Apple"},
+                ]
+            ),
+        ]
+    )
+    respond(lambda url: next(responses))
+
+    recorder.capture(
+        discovery_model.get_discovery_data(
+            url=GAINERS_URL,
+            column_mapping=discovery_model.MARKET_MOVERS_COLUMNS,
+            stream=True,
+        )
+    )
+
+
+def test_get_discovery_data_csv(
+    recorder, respond, csv_cache
+):  # pylint: disable=unused-argument
+    respond(
+        lambda url: create_response(
+            STOCK_LIST_CSV if "datatype=csv" in url else STOCK_LIST_RECORDS
+        )
+    )
+
+    csv_stock_list = get_stock_list(csv=True)
+
+    pd.testing.assert_frame_equal(csv_stock_list, get_stock_list(csv=False))
+    recorder.capture(csv_stock_list)
+
+
+def test_get_discovery_data_csv_unsupported(recorder, respond, csv_cache):
+    urls = []
+
+    def get_response(url):
+        urls.append(url)
+
+        return create_response(STOCK_LIST_RECORDS)
+
+    respond(get_response)
+
+    get_stock_list()
+
+    # The endpoint is remembered, also by other processes through the cache, so the
+    # CSV format is not requested again
+    discovery_model.CSV_UNSUPPORTED_ENDPOINTS.clear()
+    recorder.capture(get_stock_list())
+    recorder.capture([url.split("?")[1] for url in urls])
+    recorder.capture(csv_cache.load("csv_unsupported", "api_v3_stock_list"))
+
+
+def test_get_discovery_data_csv_error_message(recorder, respond, csv_cache):
+    responses = iter(
+        [
+            create_response({"Error Message": "Limit Reach . Please upgrade."}),
+            create_response(STOCK_LIST_RECORDS),
+            create_response(STOCK_LIST_CSV),
+        ]
+    )
+    respond(lambda url: next(responses))
+
+    get_stock_list()
+
+    # An error doesn't mean that the CSV format is unsupported
+    recorder.capture(get_stock_list())
+    recorder.capture(sorted(discovery_model.CSV_UNSUPPORTED_ENDPOINTS))
+    recorder.capture(csv_cache.load("csv_unsupported", "api_v3_stock_list") is None)
+
+
+def test_get_crypto_quotes_precision(recorder, respond, tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_model, "file_cache", FileCache(str(tmp_path)))
+    respond(
+        create_response(
+            [
+                {"symbol": "BTCUSD", "name": "Bitcoin", "price": 65000.123456},
+                {"symbol": "ETHUSD", "name": "Ethereum", "price": 3500.654321},
+            ]
+        )
+    )
+
+    # The quotes are cached with their full precision regardless of the setting
+    monkeypatch.setattr(discovery_model, "REDUCE_QUOTE_PRECISION", True)
+    recorder.capture(discovery_model.get_crypto_quotes("key").dtypes.astype(str))
+
+    monkeypatch.setattr(discovery_model, "REDUCE_QUOTE_PRECISION", False)
+    recorder.capture(discovery_model.get_crypto_quotes("key").dtypes.astype(str))
+
+
+def test_get_forex_quotes_empty_columns(recorder, respond, tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_model, "file_cache", FileCache(str(tmp_path)))
+    respond(
+        create_response(
+            [
+                {
+                    "symbol": symbol,
+                    "name": name,
+                    "price": price,
+                    "volume": None,
+                    "avgVolume": None,
+                    "eps": None,
+                    "pe": None,
+                    "marketCap": None,
+                    "timestamp": 1700000000,
+                }
+                for symbol, name, price in [
+                    ("EURUSD", "EUR/USD", 1.0812),
+                    ("GBPUSD", "GBP/USD", 1.2534),
+                ]
+            ]
+        )
+    )
+
+    forex_quotes = discovery_model.get_forex_quotes("key")
+
+    # Should equal dropping all empty columns afterwards as was done before
+    pd.testing.assert_frame_equal(
+        forex_quotes,
+        discovery_model.get_discovery_data(
+            url=CRYPTO_URL,
+            column_mapping=discovery_model.QUOTE_COLUMNS,
+            drop_columns=["Exchange"],
+        ).dropna(how="all", axis=1),
+    )
+    recorder.capture(forex_quotes)
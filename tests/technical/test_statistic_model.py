@@ -0,0 +1,212 @@
+"""Statistic Model Tests"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from financetoolkit.technicals import statistic_model
+
+# pylint: disable=missing-function-docstring
+
+returns = pd.Series([0.01, -0.03, 0.05, 0.01, -0.02, 0.04, -0.01, 0.02, 0.03, -0.04])
+benchmark_returns = pd.Series(
+    [0.02, -0.01, 0.03, 0.02, -0.03, 0.02, 0.01, 0.01, 0.02, -0.02]
+)
+series = np.array([1.0, 1.2, 0.9, 1.4, 1.1, 1.5, 1.3, 1.8, 1.6, 2.0, 1.7, 2.1])
+long_series = (
+    np.sin(np.arange(1000) / 7)
+    + 0.5 * np.cos(np.arange(1000) / 3)
+    + np.arange(1000) / 1000
+)
+
+
+def test_get_beta(recorder):
+    recorder.capture(round(statistic_model.get_beta(returns, benchmark_returns), 10))
+
+
+def test_get_beta_alignment(recorder):
+    # The series are aligned on their index and only the periods available in both
+    # series are used, so these should equal the beta over the same periods
+    recorder.capture(
+        round(statistic_model.get_beta(returns[::-1], benchmark_returns), 10)
+    )
+    recorder.capture(
+        round(statistic_model.get_beta(returns.iloc[2:], benchmark_returns), 10)
+    )
+    recorder.capture(
+        round(
+            statistic_model.get_beta(returns.iloc[2:], benchmark_returns.iloc[2:]), 10
+        )
+    )
+
+
+def test_get_rolling_beta(recorder):
+    recorder.capture(
+        statistic_model.get_rolling_beta(returns, benchmark_returns, 5).round(10)
+    )
+
+
+def test_get_rolling_beta_alignment(recorder):
+    # Only the periods in which both returns are available are used
+    recorder.capture(
+        statistic_model.get_rolling_beta(returns, benchmark_returns.iloc[3:], 3).round(
+            10
+        )
+    )
+
+    with pytest.raises(ValueError, match="equal length"):
+        statistic_model.get_rolling_beta(
+            returns.to_numpy(), benchmark_returns.iloc[3:].to_numpy(), 3
+        )
+
+
+def test_get_pearsons_correlation(recorder):
+    recorder.capture(
+        round(statistic_model.get_pearsons_correlation(returns, benchmark_returns), 10)
+    )
+
+
+def test_get_spearman_correlation(recorder):
+    recorder.capture(
+        round(statistic_model.get_spearman_correlation(returns, benchmark_returns), 10)
+    )
+
+
+def test_get_spearman_correlation_missing_values(recorder):
+    # The first return is missing and the order of the benchmark is reversed which
+    # should give the same result as dropping the first period of both series
+    recorder.capture(
+        round(
+            statistic_model.get_spearman_correlation(
+                returns.where(returns.index > 0), benchmark_returns[::-1]
+            ),
+            10,
+        )
+    )
+    recorder.capture(
+        round(
+            statistic_model.get_spearman_correlation(
+                returns.iloc[1:], benchmark_returns.iloc[1:]
+            ),
+            10,
+        )
+    )
+
+
+def test_get_autocovariance(recorder):
+    demeaned_series = long_series - long_series.mean()
+
+    # For 60 lags the FFT is used while 10 lags are summed directly
+    autocovariance = statistic_model.get_autocovariance(demeaned_series, 60)
+
+    np.testing.assert_allclose(
+        autocovariance,
+        statistic_model.get_autocovariance_direct(demeaned_series, 60),
+        atol=1e-12,
+    )
+    recorder.capture(pd.Series(autocovariance).round(10))
+    recorder.capture(
+        pd.Series(statistic_model.get_autocovariance(demeaned_series, 10)).round(10)
+    )
+
+
+def test_get_ar(recorder):
+    recorder.capture(
+        pd.Series(statistic_model.get_ar(series, p=2, steps=3, method="lsm")).round(10)
+    )
+    recorder.capture(
+        pd.Series(statistic_model.get_ar(series, p=2, steps=3, method="yw")).round(10)
+    )
+
+
+def test_get_ar_weights_lsm_batch(recorder):
+    data = np.column_stack([series, series[::-1], series**2])
+
+    phi, c, sigma2 = statistic_model.get_ar_weights_lsm(data, 2)
+
+    # Fitting all columns at once should equal fitting each column separately
+    for i, column_weights in enumerate(
+        statistic_model.get_ar_weights_lsm(column, 2) for column in data.T
+    ):
+        np.testing.assert_allclose(phi[i], column_weights[0])
+        np.testing.assert_allclose(c[i], column_weights[1])
+        np.testing.assert_allclose(sigma2[i], column_weights[2], atol=1e-12)
+
+    recorder.capture(pd.DataFrame(phi).round(10))
+    recorder.capture(
+        statistic_model.get_ar(pd.DataFrame(data), p=2, steps=3, method="lsm").round(10)
+    )
+
+
+def test_get_ar_weights_lsm_float32(recorder):
+    daily_returns = np.random.default_rng(0).normal(0.0005, 0.01, size=1000)
+
+    phi, c, sigma2 = statistic_model.get_ar_weights_lsm(daily_returns, 3, np.float32)
+
+    # Storing the lagged values in float32 should only affect the precision slightly
+    for value, expected in zip(
+        (phi, c, sigma2), statistic_model.get_ar_weights_lsm(daily_returns, 3)
+    ):
+        np.testing.assert_allclose(value, expected, rtol=1e-3, atol=1e-5)
+
+    recorder.capture(pd.Series([*phi, c, sigma2]).round(4))
+
+
+def test_get_ar_weights_lsm_rank_deficient(recorder):
+    # A constant series makes the lagged values collinear with the constant term so
+    # that the Cholesky decomposition fails and the SVD based solver is used instead
+    phi, c, sigma2 = statistic_model.get_ar_weights_lsm(np.full(10, 2.0), 1)
+    recorder.capture(pd.Series([*phi, c, sigma2]).round(10))
+
+    # A single rank deficient column results in fitting each column separately
+    phi, c, sigma2 = statistic_model.get_ar_weights_lsm(
+        np.column_stack([series, np.full(len(series), 2.0)]), 1
+    )
+    recorder.capture(
+        pd.DataFrame({"phi": phi[:, 0], "c": c, "sigma2": sigma2}).round(10)
+    )
+
+
+def test_get_ma(recorder):
+    recorder.capture(pd.Series(statistic_model.get_ma(series, q=2, steps=3)).round(10))
+
+
+def test_fit_ma_model(recorder):
+    # A sample of an MA(1) process with theta equal to 0.5
+    noise = np.random.default_rng(0).normal(size=301)
+    ma_series = noise[1:] + 0.5 * noise[:-1]
+
+    for method in ["innovations", "mle"]:
+        theta, sigma2, errors = statistic_model.fit_ma_model(ma_series, 2, method)
+
+        recorder.capture(pd.Series([*theta, sigma2]).round(4))
+        recorder.capture(pd.Series(errors[:5]).round(4))
+
+    with pytest.raises(ValueError, match="Method must be"):
+        statistic_model.fit_ma_model(ma_series, 2, method="ols")
+
+
+def test_fit_ma_model_invalid_data():
+    with pytest.raises(ValueError, match="missing values"):
+        statistic_model.fit_ma_model(np.append(series, np.nan), 2)
+
+    with pytest.raises(ValueError, match="larger than the MA order"):
+        statistic_model.fit_ma_model(series[:2], 2)
+
+
+def test_get_ma_fewer_errors_than_order(recorder):
+    recorder.capture(
+        pd.Series(
+            statistic_model.get_ma(
+                np.array([1.0, 2.0, 1.5, 1.7, 1.2]),
+                q=3,
+                steps=4,
+                theta=np.array([0.5, 0.3, 0.2]),
+                errors=np.array([0.1, -0.2]),
+            )
+        ).round(10)
+    )
+
+
+def test_get_ma_constant_series():
+    with pytest.raises(ValueError, match="positive variance"):
+        statistic_model.get_ma(np.ones(12), q=2)